@@ -1,32 +1,102 @@
+# eventlet must patch the stdlib before Flask/SocketIO are imported so the
+# WebSocket transport is available; fall back to threading if it's missing.
+try:
+    import eventlet
+    eventlet.monkey_patch()
+    SOCKETIO_ASYNC_MODE = 'eventlet'
+except ImportError:
+    SOCKETIO_ASYNC_MODE = 'threading'
+
 import os
+import logging
+from functools import lru_cache
 from flask import Flask
+from flask.json.provider import DefaultJSONProvider
 from flask_socketio import SocketIO
 from dotenv import load_dotenv
 from config import Config
-try:
-    from database import init_supabase
-except ImportError as e:
-    print(f"Warning: Database import failed: {e}")
-    def init_supabase():
-        print("Using mock database")
 
 # Load environment variables
 load_dotenv()
 
+# Module loggers write through the root handler instead of print()
+logging.basicConfig(
+    level=os.environ.get('LOG_LEVEL', 'WARNING').upper(),
+    format='%(asctime)s %(levelname)s %(name)s: %(message)s'
+)
+
+try:
+    from flask_session import Session
+except ImportError:  # Optional: only needed for SESSION_TYPE=redis
+    Session = None
+
+try:
+    import orjson
+except ImportError:  # Optional: jsonify() keeps the stdlib encoder
+    orjson = None
+
+class _OrjsonProvider(DefaultJSONProvider):
+    """jsonify()/request.json through orjson: C encoder, raw UTF-8 instead of \\uXXXX escapes"""
+    
+    def dumps(self, obj, **kwargs):
+        # Datetimes go through Flask's default() so they keep the HTTP-date format
+        option = orjson.OPT_NON_STR_KEYS | orjson.OPT_PASSTHROUGH_DATETIME
+        if kwargs.get('indent'):
+            option |= orjson.OPT_INDENT_2
+        return orjson.dumps(obj, default=self.default, option=option).decode()
+    
+    def loads(self, s, **kwargs):
+        return orjson.loads(s)
+
+_UPLOAD_DIRS = ('static/uploads/images', 'static/uploads/videos', 'static/uploads/documents')
+
+@lru_cache(maxsize=1)
+def _ensure_upload_dirs():
+    """Create upload directories once per process"""
+    for directory in _UPLOAD_DIRS:
+        if not os.path.isdir(directory):
+            os.makedirs(directory, exist_ok=True)
+
+# Busiest pages; compiled at startup so preload_app workers inherit them
+_HOT_TEMPLATES = ('index.html', 'explore.html', 'dashboard/main.html', 'public/tournament_details.html')
+
+def _precompile_templates(app):
+    """Load the hot templates (and base.html they extend) into Jinja's cache once"""
+    for name in _HOT_TEMPLATES:
+        try:
+            app.jinja_env.get_template(name)
+        except Exception:
+            logging.getLogger(__name__).warning("Could not precompile template %s", name, exc_info=True)
+
+def _init_server_sessions(app):
+    """Store sessions in Redis when SESSION_TYPE=redis, keeping only a signed id in the cookie"""
+    if app.config.get('SESSION_TYPE') != 'redis':
+        return
+    redis_url = os.environ.get('REDIS_URL')
+    if Session is None or not redis_url:
+        logging.getLogger(__name__).warning(
+            "SESSION_TYPE=redis needs Flask-Session and REDIS_URL; using cookie sessions")
+        return
+    import redis
+    app.config['SESSION_REDIS'] = redis.Redis.from_url(redis_url, socket_timeout=0.5)
+    Session(app)
+
 def create_app():
     app = Flask(__name__)
     app.config.from_object(Config)
+    if orjson is not None:
+        app.json = _OrjsonProvider(app)
+    _init_server_sessions(app)
     
     # Initialize SocketIO
-    socketio = SocketIO(app, cors_allowed_origins="*", async_mode='threading')
+    # With REDIS_URL set, emits are relayed through Redis so every instance's clients receive them
+    socketio = SocketIO(app, cors_allowed_origins="*", async_mode=SOCKETIO_ASYNC_MODE,
+                        message_queue=os.environ.get('REDIS_URL'))
     
-    # Initialize Supabase
-    init_supabase()
+    # The Supabase client is created on first database access (see database._lazy_init)
     
     # Create upload directories
-    upload_dirs = ['static/uploads/images', 'static/uploads/videos', 'static/uploads/documents']
-    for directory in upload_dirs:
-        os.makedirs(directory, exist_ok=True)
+    _ensure_upload_dirs()
     
     # Register blueprints
     from routes.auth import auth_bp
@@ -45,6 +115,8 @@ def create_app():
     from websocket_events import register_events
     register_events(socketio)
     
+    _precompile_templates(app)
+    
     return app, socketio
 
 if __name__ == '__main__':
@@ -54,6 +126,9 @@ if __name__ == '__main__':
     print("📍 Network access at: http://0.0.0.0:5000")
     print("💡 Press Ctrl+C to stop the server\n")
     try:
-        socketio.run(app, debug=True, host='0.0.0.0', port=5000, allow_unsafe_werkzeug=True)
+        if SOCKETIO_ASYNC_MODE == 'eventlet':
+            socketio.run(app, debug=True, host='0.0.0.0', port=5000)
+        else:
+            socketio.run(app, debug=True, host='0.0.0.0', port=5000, allow_unsafe_werkzeug=True)
     except KeyboardInterrupt:
         print("\n👋 Server stopped. Thank you for using TournamentPro!")
@@ -12,12 +12,17 @@ class Config:
     # File Upload Configuration
     MAX_CONTENT_LENGTH = int(os.environ.get('MAX_CONTENT_LENGTH', 16777216))  # 16MB
     UPLOAD_FOLDER = os.environ.get('UPLOAD_FOLDER', 'static/uploads')
-    ALLOWED_IMAGE_EXTENSIONS = {'png', 'jpg', 'jpeg', 'gif', 'webp'}
-    ALLOWED_VIDEO_EXTENSIONS = {'mp4', 'avi', 'mov', 'wmv', 'webm'}
-    ALLOWED_DOCUMENT_EXTENSIONS = {'pdf', 'doc', 'docx', 'txt'}
+    ALLOWED_IMAGE_EXTENSIONS = frozenset({'png', 'jpg', 'jpeg', 'gif', 'webp'})
+    ALLOWED_VIDEO_EXTENSIONS = frozenset({'mp4', 'avi', 'mov', 'wmv', 'webm'})
+    ALLOWED_DOCUMENT_EXTENSIONS = frozenset({'pdf', 'doc', 'docx', 'txt'})
     
     # Session Configuration
     PERMANENT_SESSION_LIFETIME = timedelta(days=30)
+    # SESSION_TYPE=redis keeps sessions server-side in REDIS_URL (needs Flask-Session);
+    # unset, Flask's signed cookie is used
+    SESSION_TYPE = os.environ.get('SESSION_TYPE')
+    SESSION_USE_SIGNER = True
+    SESSION_KEY_PREFIX = 'kickoff:session:'
     
     # App Information
     APP_NAME = os.environ.get('APP_NAME', 'TournamentPro')
@@ -1,106 +1,131 @@
 """
 Context processors to inject global data into all templates
 """
-from flask import session, request
-from routes.auth import get_current_user
-from database import db
-from datetime import datetime, timedelta
-import uuid
+from flask import session, request, g
+import logging
+from datetime import datetime, timedelta, timezone
+from functools import lru_cache
+from threading import Lock
+from cachetools import TTLCache, cached
+
+log = logging.getLogger(__name__)
+
+# Shared context for anonymous users and static files (never mutated)
+_ANON_CTX = {
+    'nav_user': None,
+    'nav_notifications': (),
+    'nav_recent_tournaments': (),
+    'nav_unread_count': 0,
+    'nav_current_path': '',
+}
+
+# Tournament status -> (id suffix, title, message, unread)
+_STATUS_NOTIFICATIONS = {
+    'registration_open': ('reg', 'Registration Active', "Players are registering for '{name}'", True),
+    'in_progress': ('progress', 'Tournament Active', "'{name}' is currently in progress", False),
+    'completed': ('complete', 'Tournament Completed', "'{name}' has finished", False),
+}
+
+# Tournament names for breadcrumbs, shared across requests
+_TOURNAMENT_NAMES = TTLCache(maxsize=1024, ttl=60)
+_TOURNAMENT_NAMES_LOCK = Lock()
+
+def _user_tournaments(user_id):
+    """Get the user's tournaments, fetched at most once per request"""
+    if not hasattr(g, '_user_tournaments'):
+        from database import db
+        g._user_tournaments = db.get_tournaments_by_user(user_id)
+    return g._user_tournaments
+
+def _skip_navigation():
+    """Check if the current request doesn't need navbar data"""
+    return request.accept_mimetypes.best == 'application/json'
 
 def navigation_context():
     """Inject navigation-related context into all templates"""
+    endpoint = request.endpoint or ''
+    if endpoint == 'static' or not session.get('user_id') or _skip_navigation():
+        return {**_ANON_CTX, 'nav_current_path': endpoint}
+    
     context = {
         'nav_user': None,
         'nav_notifications': [],
-        'nav_recent_tournaments': [],
+        'nav_recent_tournaments': (),
         'nav_unread_count': 0,
-        'nav_current_path': request.endpoint or '',
+        'nav_current_path': endpoint,
     }
     
-    # Get current user data if logged in
-    if session.get('user_id'):
-        try:
-            user = get_current_user()
-            if user:
-                context['nav_user'] = user
-                
-                # Get user's recent tournaments (last 5)
-                tournaments = db.get_tournaments_by_user(session['user_id'])
-                recent_tournaments = []
-                
-                for tournament in tournaments[:5]:  # Limit to 5 most recent
-                    recent_tournaments.append({
-                        'id': tournament.get('id'),
-                        'name': tournament.get('name'),
-                        'status': tournament.get('status', 'draft'),
-                        'created_at': tournament.get('created_at')
-                    })
-                
-                context['nav_recent_tournaments'] = recent_tournaments
-                
-                # Get real notifications (you can expand this based on your notification system)
-                notifications = get_user_notifications(session['user_id'])
-                context['nav_notifications'] = notifications
-                context['nav_unread_count'] = len([n for n in notifications if n.get('unread', False)])
-                
-        except Exception as e:
-            print(f"Error loading navigation context: {e}")
+    # Get current user data (logged in past this point)
+    try:
+        from routes.auth import get_current_user
+        user = get_current_user()
+        if user:
+            context['nav_user'] = user
+            
+            # Get user's recent tournaments (last 5)
+            tournaments = _user_tournaments(session['user_id'])
+            context['nav_recent_tournaments'] = tuple(
+                {
+                    'id': tournament.get('id'),
+                    'name': tournament.get('name'),
+                    'status': tournament.get('status', 'draft'),
+                    'created_at': tournament.get('created_at')
+                }
+                for tournament in tournaments[:5]  # Limit to 5 most recent
+            )
+            
+            # Get real notifications (you can expand this based on your notification system)
+            notifications, unread_count = get_user_notifications(session['user_id'], tournaments)
+            context['nav_notifications'] = notifications
+            context['nav_unread_count'] = unread_count
+            
+    except Exception:
+        log.warning("Error loading navigation context", exc_info=True)
     
     return context
 
-def get_user_notifications(user_id):
-    """Get real notifications for a user"""
+def get_user_notifications(user_id, tournaments=None):
+    """Get real notifications for a user as (notifications, unread_count)"""
     try:
         # For now, we'll create some sample notifications based on real user data
         # In a real app, you'd query a notifications table
         notifications = []
+        unread_count = 0
         
         # Get user's tournaments to generate relevant notifications
-        tournaments = db.get_tournaments_by_user(user_id)
+        if tournaments is None:
+            tournaments = _user_tournaments(user_id)
         
         if tournaments:
+            # Timestamps come back from Supabase in UTC
+            now = datetime.now(timezone.utc).replace(tzinfo=None)
+            
             # Create notifications based on tournament activity
             for tournament in tournaments[:3]:  # Limit to avoid too many notifications
-                status = tournament.get('status', 'draft')
+                template = _STATUS_NOTIFICATIONS.get(tournament.get('status', 'draft'))
+                if not template:
+                    continue
                 
-                if status == 'registration_open':
-                    notifications.append({
-                        'id': f"notif_{tournament.get('id', '')}_reg",
-                        'title': 'Registration Active',
-                        'message': f"Players are registering for '{tournament.get('name', 'Tournament')}'",
-                        'time': get_time_ago(tournament.get('updated_at', tournament.get('created_at'))),
-                        'unread': True,
-                        'type': 'tournament',
-                        'tournament_id': tournament.get('id')
-                    })
-                    
-                elif status == 'in_progress':
-                    notifications.append({
-                        'id': f"notif_{tournament.get('id', '')}_progress",
-                        'title': 'Tournament Active',
-                        'message': f"'{tournament.get('name', 'Tournament')}' is currently in progress",
-                        'time': get_time_ago(tournament.get('updated_at', tournament.get('created_at'))),
-                        'unread': False,
-                        'type': 'tournament',
-                        'tournament_id': tournament.get('id')
-                    })
-                    
-                elif status == 'completed':
-                    notifications.append({
-                        'id': f"notif_{tournament.get('id', '')}_complete",
-                        'title': 'Tournament Completed',
-                        'message': f"'{tournament.get('name', 'Tournament')}' has finished",
-                        'time': get_time_ago(tournament.get('updated_at', tournament.get('created_at'))),
-                        'unread': False,
-                        'type': 'tournament',
-                        'tournament_id': tournament.get('id')
-                    })
+                suffix, title, message, unread = template
+                timestamp = tournament.get('updated_at', tournament.get('created_at'))
+                sort_ts = _sort_timestamp(timestamp)
+                unread_count += unread
+                notifications.append({
+                    'id': f"notif_{tournament.get('id', '')}_{suffix}",
+                    'title': title,
+                    'message': message.format(name=tournament.get('name', 'Tournament')),
+                    'time': get_time_ago(timestamp, now),
+                    '_sort_ts': sort_ts,
+                    'unread': unread,
+                    'type': 'tournament',
+                    'tournament_id': tournament.get('id')
+                })
         
         # Add some system notifications if no tournaments
         if not notifications:
             notifications = [
                 {
-                    'id': 'welcome_' + str(uuid.uuid4())[:8],
+                    'id': f'welcome_{user_id}',
                     'title': 'Welcome to TournamentPro',
                     'message': 'Create your first tournament to get started',
                     'time': '1 hour ago',
@@ -108,36 +133,46 @@ def get_user_notifications(user_id):
                     'type': 'system'
                 }
             ]
+            unread_count = 1
             
         # Sort by unread first, then by time (most recent first)
-        notifications.sort(key=lambda x: (not x.get('unread', False), x.get('time', '')))
+        notifications.sort(key=lambda x: (not x.get('unread', False), -x.get('_sort_ts', 0.0)))
+        for notification in notifications:
+            notification.pop('_sort_ts', None)
         
-        return notifications[:10]  # Limit to 10 notifications
+        # At most 3 tournament notifications, so the 10 cap never drops unread ones
+        return notifications[:10], unread_count
         
-    except Exception as e:
-        print(f"Error getting notifications: {e}")
-        return []
+    except Exception:
+        log.warning("Error getting notifications", exc_info=True)
+        return [], 0
 
-def get_time_ago(timestamp_str):
+def _sort_timestamp(timestamp_str):
+    """Numeric sort key for a timestamp (0 if missing or unparseable)"""
+    try:
+        return datetime.fromisoformat(timestamp_str[:19]).timestamp()
+    except (TypeError, ValueError):
+        return 0.0
+
+def get_time_ago(timestamp_str, now=None):
     """Convert timestamp to human-readable time ago format"""
+    if not timestamp_str:
+        return "Just now"
+    if now is None:
+        now = datetime.now(timezone.utc).replace(tzinfo=None)
+    # Minute resolution is all the output needs, and it lets repeats hit the cache
+    return _time_ago(timestamp_str, now.replace(second=0, microsecond=0))
+
+@lru_cache(maxsize=1024)
+def _time_ago(timestamp_str, now):
     try:
-        if not timestamp_str:
-            return "Just now"
-            
-        # Parse the timestamp
-        if 'T' in timestamp_str:
-            dt = datetime.fromisoformat(timestamp_str.replace('Z', '+00:00'))
-        else:
-            dt = datetime.fromisoformat(timestamp_str)
-            
-        # Remove timezone info for comparison if present
-        if dt.tzinfo:
-            dt = dt.replace(tzinfo=None)
-            
-        now = datetime.now()
+        # Only the 'YYYY-MM-DDTHH:MM:SS' prefix matters; fractions and offsets are dropped
+        dt = datetime.fromisoformat(timestamp_str[:19])
         diff = now - dt
         
-        if diff.days > 7:
+        if diff.days < 0:  # within the current minute bucket
+            return "Just now"
+        elif diff.days > 7:
             return f"{diff.days // 7} week{'s' if diff.days // 7 > 1 else ''} ago"
         elif diff.days > 0:
             return f"{diff.days} day{'s' if diff.days > 1 else ''} ago"
@@ -150,8 +185,8 @@ def get_time_ago(timestamp_str):
         else:
             return "Just now"
             
-    except Exception as e:
-        print(f"Error parsing timestamp {timestamp_str}: {e}")
+    except Exception:
+        log.warning("Error parsing timestamp %s", timestamp_str, exc_info=True)
         return "Recently"
 
 def search_context():
@@ -166,62 +201,72 @@ def breadcrumb_helpers():
         'get_breadcrumbs': get_breadcrumbs_for_route
     }
 
+@cached(_TOURNAMENT_NAMES, key=lambda tournament_id: tournament_id, lock=_TOURNAMENT_NAMES_LOCK)
+def _cached_tournament_name(tournament_id):
+    """Get a tournament's name (None if it doesn't exist)"""
+    from routes.auth import get_current_tournament
+    tournament = get_current_tournament(tournament_id)
+    return tournament.get('name', 'Tournament Details') if tournament else None
+
+def invalidate_tournament_name(tournament_id):
+    """Drop a tournament's cached breadcrumb name after it changes"""
+    with _TOURNAMENT_NAMES_LOCK:
+        _TOURNAMENT_NAMES.pop(tournament_id, None)
+
+# Breadcrumbs for endpoints that don't depend on view args
+_BREADCRUMBS = {
+    'main.dashboard': ({'name': 'Dashboard'},),
+    'main.explore': ({'name': 'Explore Tournaments'},),
+    'main.features': ({'name': 'Features'},),
+    'main.about': ({'name': 'About'},),
+    'main.contact': ({'name': 'Contact'},),
+    'auth.profile': ({'name': 'Profile'},),
+    'auth.update_profile': ({'name': 'Profile'},),
+    'auth.login': ({'name': 'Sign In'},),
+    'auth.register': ({'name': 'Sign Up'},),
+}
+
+# Tournament sub-pages shown after the tournament name
+_TOURNAMENT_SUB_PAGES = {
+    'view': None,
+    'participants': 'Participants',
+    'matches': 'Matches',
+    'standings': 'Standings',
+}
+
 def get_breadcrumbs_for_route():
     """Generate breadcrumbs based on current route"""
-    breadcrumbs = []
     endpoint = request.endpoint
     
     if not endpoint:
-        return breadcrumbs
+        return []
     
-    # Define breadcrumb patterns
-    if endpoint.startswith('main.dashboard'):
-        breadcrumbs = [{'name': 'Dashboard'}]
-        
-    elif endpoint.startswith('tournament.'):
-        breadcrumbs.append({'name': 'Tournaments', 'url': '/explore'})
-        
-        if 'create' in endpoint:
-            breadcrumbs.append({'name': 'Create Tournament'})
-        elif 'edit' in endpoint:
-            breadcrumbs.append({'name': 'Edit Tournament'})
-        elif 'view' in endpoint:
-            # You might want to get the actual tournament name here
-            tournament_id = request.view_args.get('tournament_id')
-            if tournament_id:
-                tournament = db.get_tournament_by_id(tournament_id)
-                if tournament:
-                    breadcrumbs.append({
-                        'name': tournament.get('name', 'Tournament Details'),
-                        'url': f'/tournament/{tournament_id}'
-                    })
-                    
-                    # Add specific pages
-                    if 'participants' in endpoint:
-                        breadcrumbs.append({'name': 'Participants'})
-                    elif 'matches' in endpoint:
-                        breadcrumbs.append({'name': 'Matches'})
-                    elif 'standings' in endpoint:
-                        breadcrumbs.append({'name': 'Standings'})
-                        
-    elif endpoint.startswith('auth.'):
-        if 'profile' in endpoint:
-            breadcrumbs = [{'name': 'Profile'}]
-        elif 'login' in endpoint:
-            breadcrumbs = [{'name': 'Sign In'}]
-        elif 'register' in endpoint:
-            breadcrumbs = [{'name': 'Sign Up'}]
-            
-    elif endpoint.startswith('main.explore'):
-        breadcrumbs = [{'name': 'Explore Tournaments'}]
-        
-    elif endpoint.startswith('main.features'):
-        breadcrumbs = [{'name': 'Features'}]
-        
-    elif endpoint.startswith('main.about'):
-        breadcrumbs = [{'name': 'About'}]
-        
-    elif endpoint.startswith('main.contact'):
-        breadcrumbs = [{'name': 'Contact'}]
+    static_breadcrumbs = _BREADCRUMBS.get(endpoint)
+    if static_breadcrumbs is not None:
+        return list(static_breadcrumbs)
+    
+    blueprint, _, action = endpoint.partition('.')
+    if blueprint != 'tournament':
+        return []
+    
+    breadcrumbs = [{'name': 'Tournaments', 'url': '/explore'}]
+    
+    if 'create' in action:
+        breadcrumbs.append({'name': 'Create Tournament'})
+    elif 'edit' in action:
+        breadcrumbs.append({'name': 'Edit Tournament'})
+    elif action in _TOURNAMENT_SUB_PAGES:
+        tournament_id = request.view_args.get('tournament_id')
+        if tournament_id:
+            tournament_name = _cached_tournament_name(tournament_id)
+            if tournament_name:
+                breadcrumbs.append({
+                    'name': tournament_name,
+                    'url': f'/tournament/{tournament_id}'
+                })
+                
+                sub_page = _TOURNAMENT_SUB_PAGES[action]
+                if sub_page:
+                    breadcrumbs.append({'name': sub_page})
     
     return breadcrumbs
@@ -1,95 +1,445 @@
 import os
-from supabase import create_client, Client
-from typing import Optional, Dict, List, Any
-from datetime import datetime
-import uuid
-from uuid import uuid4
+import logging
+import random
 import time
-from functools import lru_cache
+import json
+from typing import Optional, Dict, List, Any, TYPE_CHECKING
+from datetime import datetime, timezone
+import uuid
+from threading import Lock, RLock
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from cachetools import TTLCache
 
-# Global Supabase client
-supabase: Optional[Client] = None
+try:
+    import redis
+except ImportError:  # Optional: only needed when REDIS_URL is set
+    redis = None
 
-def init_supabase():
-    """Initialize Supabase client with optimized settings"""
-    global supabase
+try:
+    import eventlet
+except ImportError:  # Threading mode: fan-out uses the thread pool below
+    eventlet = None
+
+try:
+    import orjson
+except ImportError:  # Optional: faster JSON, falls back to stdlib
+    orjson = None
+
+if TYPE_CHECKING:
+    from supabase import Client
+
+log = logging.getLogger(__name__)
+
+
+class _RateLimitFilter(logging.Filter):
+    """Let each distinct log message through at most once per interval"""
+    
+    def __init__(self, interval: float = 1.0):
+        super().__init__()
+        self.interval = interval
+        self._last_emitted = {}
+    
+    def filter(self, record):
+        now = time.monotonic()
+        if now - self._last_emitted.get(record.msg, 0.0) < self.interval:
+            return False
+        self._last_emitted[record.msg] = now
+        return True
+
+
+# A Supabase outage fails every query at once; keep it from flooding the logs
+log.addFilter(_RateLimitFilter())
+
+def _now_iso() -> str:
+    """Current UTC time as an ISO string; compute once per operation and reuse"""
+    return datetime.now(timezone.utc).isoformat(timespec='seconds')
+
+def _new_ids(n: int) -> List[str]:
+    """n random (version 4) UUID hex strings from a single urandom read"""
+    raw = os.urandom(16 * n)
+    return [uuid.UUID(bytes=raw[i:i + 16], version=4).hex for i in range(0, 16 * n, 16)]
+
+def _tune_postgrest_session(client: 'Client') -> None:
+    """Replace the PostgREST httpx session with one using bounded pool limits"""
+    import httpx
+    postgrest = getattr(client, 'postgrest', None)
+    session = getattr(postgrest, 'session', None)
+    if session is None:
+        return
+    # Bounded connection pool, sized well under Supabase's per-project connection limit.
+    # keepalive_expiry recycles idle connections before the server side drops them.
+    postgrest.session = httpx.Client(
+        base_url=session.base_url,
+        headers=session.headers,
+        timeout=httpx.Timeout(10.0, connect=2.0),
+        limits=httpx.Limits(max_connections=10, max_keepalive_connections=5, keepalive_expiry=30),
+        follow_redirects=True,
+    )
+    session.close()
+
+def _use_orjson_for_responses() -> None:
+    """Decode httpx JSON bodies, and so every PostgREST result, with orjson"""
+    import httpx
+    stdlib_json = httpx.Response.json
+    
+    def orjson_json(self, **kwargs):
+        if kwargs:
+            return stdlib_json(self, **kwargs)
+        return orjson.loads(self.content)
+    
+    httpx.Response.json = orjson_json
+
+if orjson is not None:
+    _json_dumps, _json_loads = orjson.dumps, orjson.loads
+else:
+    _json_dumps, _json_loads = json.dumps, json.loads
+
+def _execute_with_retry(query, tries: int = 3, base: float = 0.05, cap: float = 0.5):
+    """Execute a read query, retrying transient network errors with jittered backoff"""
+    import httpx  # Already loaded by the Supabase client that built the query
+    for attempt in range(tries):
+        try:
+            return query.execute()
+        except httpx.TransportError:
+            if attempt == tries - 1:
+                raise
+            time.sleep(random.uniform(0, min(cap, base * 2 ** attempt)))
+
+# Column projections for hot reads. Limited to columns the app itself writes,
+# so every listed column is known to exist.
+_USER_COLUMNS = 'id,email,full_name,created_at'
+_SOLO_MATCH_COLUMNS = (
+    'id,tournament_id,participant1_id,participant2_id,participant1_score,participant2_score,'
+    'status,winner_id,round_name,scheduled_date,created_at'
+)
+
+# Why registration is refused for a tournament that is not open
+_REGISTRATION_STATUS_MESSAGES = {
+    'draft': 'Registration has not started yet for this tournament',
+    'in_progress': 'Registration is closed - tournament has already started',
+    'completed': 'This tournament has already ended',
+    'cancelled': 'This tournament has been cancelled'
+}
+
+def _head_count(query) -> int:
+    """Send a count='exact' select as HEAD and read the total from Content-Range.
+
+    postgrest-py builds the HEAD request for a column-less select but then
+    tries to JSON-decode the empty body and reports count=0, so the request
+    is sent directly through the builder's session here.
+    """
+    import httpx  # Already loaded by the Supabase client that built the query
+    for attempt in range(3):
+        try:
+            response = query.session.request(query.http_method, query.path, params=query.params, headers=query.headers)
+            break
+        except httpx.TransportError:
+            if attempt == 2:
+                raise
+            time.sleep(random.uniform(0, min(0.5, 0.05 * 2 ** attempt)))
+    response.raise_for_status()
+    # Content-Range: 0-0/42, or */0 when nothing matches
+    return int(response.headers.get('content-range', '*/0').rsplit('/', 1)[-1])
+
+def _embedded_count(row: Dict, relation: str) -> int:
+    """Read a PostgREST relation(count) embed, e.g. {'participants': [{'count': 3}]}"""
+    embedded = row.get(relation) or [{}]
+    return embedded[0].get('count', 0)
+
+def _normalize_email(email: Optional[str]) -> Optional[str]:
+    """Lower-case and trim an email; blank becomes None"""
+    return (email or '').strip().lower() or None
+
+def _next_short_name(base_name: str, taken: set) -> str:
+    """First base_name + n (n >= 1) not in taken, which holds names starting with base_name"""
+    used = {name[len(base_name):] for name in taken}
+    counter = 1
+    while str(counter) in used:
+        counter += 1
+    return f"{base_name}{counter}"
+
+def _ilike_literal(value: str) -> str:
+    """Escape LIKE wildcards so an ilike filter matches the value exactly, ignoring case"""
+    return value.replace('\\', '\\\\').replace('%', '\\%').replace('_', '\\_')
+
+def _summarize_sub_matches(sub_matches: List[Dict]) -> Dict:
+    """Win/draw/goal totals over completed sub-matches; mirrors the match_summary_v view"""
+    team1_wins = team2_wins = draws = team1_total_goals = team2_total_goals = 0
+    
+    for sub_match in sub_matches:
+        if sub_match.get('status') == 'completed':
+            goals1 = sub_match.get('team1_player_goals') or 0
+            goals2 = sub_match.get('team2_player_goals') or 0
+            
+            team1_total_goals += goals1
+            team2_total_goals += goals2
+            
+            if goals1 > goals2:
+                team1_wins += 1
+            elif goals2 > goals1:
+                team2_wins += 1
+            else:
+                draws += 1
+    
+    return {
+        'team1_wins': team1_wins,
+        'team2_wins': team2_wins,
+        'draws': draws,
+        'team1_total_goals': team1_total_goals,
+        'team2_total_goals': team2_total_goals,
+        'completed_sub_matches': team1_wins + team2_wins + draws,
+        'total_sub_matches': len(sub_matches)
+    }
+
+def _derive_sub_match_result(sub_match_data: Dict) -> Dict:
+    """Fill in winner/status the way the sub_matches trigger does; used without a database"""
+    now = _now_iso()
+    sub_match_data['updated_at'] = now
+    goals1 = sub_match_data.get('team1_player_goals')
+    goals2 = sub_match_data.get('team2_player_goals')
+    
+    # Only a fully entered score decides the sub-match
+    if goals1 is not None and goals2 is not None:
+        if goals1 > goals2:
+            sub_match_data['winner_id'] = sub_match_data.get('team1_player_id')
+        elif goals2 > goals1:
+            sub_match_data['winner_id'] = sub_match_data.get('team2_player_id')
+        else:
+            sub_match_data['winner_id'] = None  # Draw
+        sub_match_data['status'] = 'completed'
+        sub_match_data['completed_at'] = now
+    return sub_match_data
+
+def _init_redis():
+    """Connect to the shared cache if REDIS_URL is configured"""
+    url = os.environ.get('REDIS_URL')
+    if not url or redis is None:
+        return None
+    pool = redis.BlockingConnectionPool.from_url(url, max_connections=32, timeout=1, socket_timeout=0.5)
+    return redis.Redis(connection_pool=pool)
+
+# Global Supabase client, created on first use
+supabase: Optional['Client'] = None
+_supabase_ready = False
+_supabase_lock = Lock()
+
+def _create_supabase_client():
+    """Build the Supabase client from the environment, or None for development mode"""
     url = os.environ.get('SUPABASE_URL')
     key = os.environ.get('SUPABASE_ANON_KEY')
     
-    if url and key:
-        # Create client with basic optimizations
-        try:
-            supabase = create_client(url, key)
-            print("✅ Supabase client initialized with optimizations")
-        except Exception as e:
-            print(f"⚠️ Failed to create Supabase client: {e}")
-            supabase = None
-    else:
-        print("⚠️ Supabase credentials not found in environment variables")
-        # For development, we'll create a mock client
-        supabase = None
+    if not (url and key):
+        log.warning("Supabase credentials not found in environment variables")
+        # For development, we'll run against mock data
+        return None
     
+    try:
+        # supabase/postgrest/httpx are only imported once something actually needs the database
+        from supabase import create_client
+        client = create_client(url, key)
+        _tune_postgrest_session(client)
+        if orjson is not None:
+            _use_orjson_for_responses()
+        log.info("Supabase client initialized")
+        return client
+    except Exception as e:
+        log.warning("Failed to create Supabase client: %s", e)
+        return None
+
+def _lazy_init():
+    """Return the Supabase client, creating it on first call"""
+    global supabase, _supabase_ready
+    if not _supabase_ready:
+        with _supabase_lock:
+            if not _supabase_ready:
+                supabase = _create_supabase_client()
+                _supabase_ready = True
     return supabase
 
+def init_supabase():
+    """Warm up the Supabase client ahead of the first query; safe to call repeatedly"""
+    return _lazy_init()
+
 def get_supabase_client():
     """Get the Supabase client instance"""
-    return supabase
+    return _lazy_init()
+
+# Fanning out independent queries: a GreenPool under eventlet (a native pool's C queue
+# would block the hub), a small thread pool in threading mode
+_green_query_pool = eventlet.GreenPool(8) if eventlet is not None else None
+_query_pool = ThreadPoolExecutor(max_workers=8, thread_name_prefix='db-query')
+
+def _green_mode() -> bool:
+    """True when eventlet has monkey-patched threading (gunicorn eventlet worker / app.py)"""
+    return eventlet is not None and eventlet.patcher.is_monkey_patched('thread')
 
 class DatabaseManager:
     """Database operations manager for Supabase"""
     
     def __init__(self):
-        self._user_cache = {}  # Simple in-memory cache
-        self._cache_timeout = 300  # 5 minutes cache timeout
+        self._cache_timeout = 3600  # Entries are invalidated on writes, so the TTL only bounds drift
+        self._user_tournaments_timeout = 30  # Short TTL for navbar tournament lists
+        self._cache_lock = RLock()  # Instances are shared across request threads
+        self._user_cache = TTLCache(maxsize=10_000, ttl=self._cache_timeout)
+        self._user_tournaments_cache = TTLCache(maxsize=1024, ttl=self._user_tournaments_timeout)
+        self._negative_cache = TTLCache(maxsize=10_000, ttl=30)  # Lookups that found no row
+        self._details_cache = TTLCache(maxsize=1024, ttl=10)  # Public tournament pages; deletes may lag by the TTL
+        self._redis = _init_redis()  # Shared across workers when configured; TTLCaches otherwise
         self._dev_solo_matches = {}  # In-memory storage for development solo matches
     
     @property
     def client(self):
         """Dynamically get the current Supabase client"""
-        return get_supabase_client()
+        return _lazy_init()
     
     def _cache_key(self, table, identifier):
         """Generate cache key"""
         return f"{table}:{identifier}"
     
-    def _get_from_cache(self, key):
+    def _redis_key(self, key, cache):
+        """Namespace a cache key for the shared Redis cache"""
+        prefix = 'missing:' if cache is self._negative_cache else ''
+        return f"kickoff:{prefix}{key}"
+    
+    def _get_from_cache(self, key, cache=None):
         """Get item from cache if not expired"""
-        if key in self._user_cache:
-            data, timestamp = self._user_cache[key]
-            if time.time() - timestamp < self._cache_timeout:
-                return data
-            else:
-                del self._user_cache[key]
-        return None
+        cache = self._user_cache if cache is None else cache
+        if self._redis:
+            try:
+                raw = self._redis.get(self._redis_key(key, cache))
+                return _json_loads(raw) if raw else None
+            except redis.RedisError:
+                log.warning("Redis cache read failed; using local cache")
+        with self._cache_lock:
+            return cache.get(key)
     
-    def _set_cache(self, key, data):
+    def _set_cache(self, key, data, cache=None):
         """Set item in cache"""
-        self._user_cache[key] = (data, time.time())
+        cache = self._user_cache if cache is None else cache
+        if self._redis:
+            try:
+                self._redis.setex(self._redis_key(key, cache), int(cache.ttl), _json_dumps(data))
+                return
+            except redis.RedisError:
+                log.warning("Redis cache write failed; using local cache")
+        with self._cache_lock:
+            cache[key] = data
+    
+    def _delete_from_cache(self, keys, caches):
+        """Drop keys from the given caches"""
+        if self._redis:
+            try:
+                self._redis.delete(*(self._redis_key(key, cache) for cache in caches for key in keys))
+            except redis.RedisError:
+                log.warning("Redis cache delete failed")
+        with self._cache_lock:
+            for cache in caches:
+                for key in keys:
+                    cache.pop(key, None)
+    
+    def _is_known_missing(self, key):
+        """Check whether a lookup recently found no row"""
+        return self._get_from_cache(key, self._negative_cache) is not None
+    
+    def _remember_missing(self, key):
+        """Remember briefly that a lookup found no row"""
+        self._set_cache(key, True, self._negative_cache)
     
     def _clear_user_cache(self, email=None):
         """Clear user cache for specific email or all"""
         if email:
-            key = self._cache_key('user', email)
-            if key in self._user_cache:
-                del self._user_cache[key]
+            self._invalidate('users', email=email)
         else:
-            self._user_cache.clear()
+            if self._redis:
+                try:
+                    keys = list(self._redis.scan_iter('kickoff:*'))
+                    if keys:
+                        self._redis.delete(*keys)
+                except redis.RedisError:
+                    log.warning("Redis cache clear failed")
+            with self._cache_lock:
+                self._user_cache.clear()
+                self._negative_cache.clear()
+    
+    def _clear_user_tournaments_cache(self, user_id):
+        """Clear cached tournament list for an organizer"""
+        if user_id:
+            self._delete_from_cache([self._cache_key('user_tournaments', user_id)], (self._user_tournaments_cache,))
+    
+    def _clear_tournament_details_cache(self, tournament_id):
+        """Clear the cached public details (and capacity counts) for a tournament"""
+        if tournament_id:
+            self._delete_from_cache([self._cache_key('tournament_details', tournament_id)], (self._details_cache,))
+    
+    def _invalidate(self, table, id=None, email=None):
+        """Drop cached rows for a table after a write"""
+        keys = []
+        if id:
+            keys.append(self._cache_key(table, id))
+        if email:
+            keys.append(self._cache_key(table, f'email:{email}'))
+        if keys:
+            self._delete_from_cache(keys, (self._user_cache, self._negative_cache))
+    
+    def _get_one(self, table: str, row_id: str, columns: str = '*') -> Optional[Dict]:
+        """Fetch a single row by ID as an object, or None if it does not exist"""
+        response = _execute_with_retry(self.client.table(table).select(columns).eq('id', row_id).maybe_single())
+        return response.data if response else None
+    
+    def _get_by_ids(self, table: str, ids, columns: str = '*') -> Dict[str, Dict]:
+        """Fetch rows by ID in a single query, keyed by ID"""
+        ids = list({i for i in ids if i})
+        if not ids:
+            return {}
+        response = _execute_with_retry(self.client.table(table).select(columns).in_('id', ids))
+        return {row['id']: row for row in response.data}
+    
+    def _count_rows(self, table: str, column: str, value: str) -> int:
+        """COUNT(*) of rows where column = value as a HEAD request; no rows come back"""
+        return _head_count(self.client.table(table).select(count='exact').eq(column, value))
+    
+    def _iter_pages(self, make_query, chunk: int):
+        """Yield rows one Range page at a time; make_query must return a fresh, ordered builder"""
+        offset = 0
+        while True:
+            rows = _execute_with_retry(make_query().range(offset, offset + chunk - 1)).data
+            yield from rows
+            if len(rows) < chunk:
+                return
+            offset += chunk
+    
+    def _gather(self, *calls):
+        """Run independent queries concurrently and return their results in order"""
+        if _green_mode():
+            green_threads = [_green_query_pool.spawn(call) for call in calls]
+            return [green_thread.wait() for green_thread in green_threads]
+        futures = [_query_pool.submit(call) for call in calls]
+        return [future.result() for future in futures]
+    
+    def get_tournament_page(self, tournament_id: str, tournament_type: str):
+        """Fetch a tournament's entrants and matches concurrently"""
+        if tournament_type == 'solo':
+            return self._gather(partial(self.get_participants_by_tournament, tournament_id),
+                                partial(self.get_solo_matches_by_tournament, tournament_id))
+        return self._gather(partial(self.get_teams_by_tournament, tournament_id),
+                            partial(self.get_matches_by_tournament, tournament_id))
     
     # User operations
-    def create_user(self, email: str, password: str, full_name: str) -> Dict:
+    def create_user(self, email: str, password: Optional[str], full_name: str) -> Dict:
         """Create a new user"""
         try:
             if not self.client:
                 # Mock response for development - simulate successful creation
-                print(f"Mock: Creating user with email {email}")
+                log.debug("Mock: Creating user with email %s", email)
                 user = {
-                    'id': str(uuid.uuid4()),
+                    'id': uuid.uuid4().hex,
                     'email': email,
                     'full_name': full_name,
-                    'created_at': datetime.now().isoformat()
+                    'created_at': _now_iso()
                 }
                 # Update cache
-                self._set_cache(self._cache_key('user', email), user)
+                self._set_cache(self._cache_key('users', f'email:{email}'), user)
                 return {
                     'success': True,
                     'user': user
@@ -99,11 +449,11 @@ class DatabaseManager:
             response = self.client.table('users').insert({
                 'email': email,
                 'full_name': full_name,
-                'created_at': datetime.now().isoformat()
+                'created_at': _now_iso()
             }).execute()
             user = response.data[0]
             # Update cache
-            self._set_cache(self._cache_key('user', email), user)
+            self._set_cache(self._cache_key('users', f'email:{email}'), user)
             return {'success': True, 'user': user}
         except Exception as e:
             # Check if it's a duplicate key error
@@ -112,30 +462,34 @@ class DatabaseManager:
                 return {'success': False, 'error': 'An account with this email already exists'}
             return {'success': False, 'error': str(e)}
     
-    def create_user_if_not_exists(self, email: str, password: str, full_name: str) -> Dict:
-        """Optimized user creation that checks existence efficiently"""
+    def create_user_if_not_exists(self, email: str, password: Optional[str], full_name: str) -> Dict:
+        """Create a user in a single insert that does nothing if the email is taken"""
         try:
             if not self.client:
                 # Mock: check if user exists first
-                cache_key = self._cache_key('user', email)
+                cache_key = self._cache_key('users', f'email:{email}')
                 if self._get_from_cache(cache_key):
                     return {'success': False, 'error': 'An account with this email already exists'}
                 # Create mock user
                 return self.create_user(email, password, full_name)
             
-            # For Supabase, use upsert with conflict handling
-            response = self.client.table('users').upsert({
+            # INSERT ... ON CONFLICT (email) DO NOTHING: one round-trip, and an existing
+            # account is left untouched (no row comes back for it)
+            response = _execute_with_retry(self.client.table('users').upsert({
                 'email': email,
                 'full_name': full_name,
-                'created_at': datetime.now().isoformat()
-            }, on_conflict='email', ignore_duplicates=False).execute()
+                'created_at': _now_iso()
+            }, on_conflict='email', ignore_duplicates=True))
             
-            if response.data:
-                user = response.data[0]
-                self._set_cache(self._cache_key('user', email), user)
-                return {'success': True, 'user': user}
-            else:
-                return {'success': False, 'error': 'Failed to create user'}
+            if not response.data:
+                return {'success': False, 'error': 'An account with this email already exists'}
+            
+            user = response.data[0]
+            # Seed both lookups: login reads by email, every later request by ID
+            self._invalidate('users', email=email)
+            self._set_cache(self._cache_key('users', f'email:{email}'), user)
+            self._set_cache(self._cache_key('users', user['id']), user)
+            return {'success': True, 'user': user}
                 
         except Exception as e:
             error_msg = str(e).lower()
@@ -151,65 +505,78 @@ class DatabaseManager:
                 return None
             
             # Check cache first
-            cache_key = self._cache_key('user', email)
+            cache_key = self._cache_key('users', f'email:{email}')
             cached_user = self._get_from_cache(cache_key)
             if cached_user is not None:
                 return cached_user
+            if self._is_known_missing(cache_key):
+                return None
             
             # Query database with optimized select
-            response = self.client.table('users').select('id,email,full_name,created_at').eq('email', email).limit(1).execute()
+            response = _execute_with_retry(self.client.table('users').select(_USER_COLUMNS).eq('email', email).limit(1))
             user = response.data[0] if response.data else None
             
-            # Cache the result (including None results to avoid repeated queries)
-            self._set_cache(cache_key, user)
+            # Misses go to the short-lived negative cache so new sign-ups show up quickly
+            if user:
+                self._set_cache(cache_key, user)
+            else:
+                self._remember_missing(cache_key)
             return user
         except Exception as e:
-            print(f"Error getting user: {e}")
+            log.exception("Error getting user")
             return None
     
     def get_user_by_id(self, user_id: str) -> Optional[Dict]:
-        """Get user by ID"""
+        """Get user by ID with caching"""
         try:
             if not self.client:
-                return {
-                    'id': user_id,
-                    'email': 'test@example.com',
-                    'full_name': 'Test User',
-                    'created_at': datetime.now().isoformat()
-                }
+                from mock_data import MOCK_USER
+                return {**MOCK_USER, 'id': user_id}
             
-            response = self.client.table('users').select('*').eq('id', user_id).execute()
-            return response.data[0] if response.data else None
+            cache_key = self._cache_key('users', user_id)
+            cached_user = self._get_from_cache(cache_key)
+            if cached_user is not None:
+                return cached_user
+            
+            user = self._get_one('users', user_id, _USER_COLUMNS)
+            if user:
+                self._set_cache(cache_key, user)
+            return user
         except Exception as e:
-            print(f"Error getting user by ID: {e}")
+            log.exception("Error getting user by ID")
             return None
     
     # Tournament operations
     def create_tournament(self, tournament_data: Dict) -> Dict:
         """Create a new tournament"""
         try:
-            tournament_data['id'] = str(uuid.uuid4())
-            tournament_data['created_at'] = datetime.now().isoformat()
-            tournament_data['updated_at'] = datetime.now().isoformat()
-            
             if not self.client:
+                tournament_data['id'] = uuid.uuid4().hex
+                tournament_data['created_at'] = tournament_data['updated_at'] = _now_iso()
                 return {'success': True, 'tournament': tournament_data}
             
             response = self.client.table('tournaments').insert(tournament_data).execute()
+            self._clear_user_tournaments_cache(tournament_data.get('organizer_id'))
             return {'success': True, 'tournament': response.data[0]}
         except Exception as e:
             return {'success': False, 'error': str(e)}
     
     def get_tournaments_by_user(self, user_id: str) -> List[Dict]:
-        """Get all tournaments created by a user"""
+        """Get all tournaments created by a user (cached briefly for the navbar)"""
         try:
             if not self.client:
                 return []
             
-            response = self.client.table('tournaments').select('*').eq('organizer_id', user_id).execute()
+            cache_key = self._cache_key('user_tournaments', user_id)
+            cached = self._get_from_cache(cache_key, self._user_tournaments_cache)
+            if cached is not None:
+                return cached
+            
+            response = _execute_with_retry(self.client.table('tournaments').select('*').eq('organizer_id', user_id))
+            self._set_cache(cache_key, response.data, self._user_tournaments_cache)
             return response.data
         except Exception as e:
-            print(f"Error getting tournaments: {e}")
+            log.exception("Error getting tournaments")
             return []
     
     def get_tournament_by_id(self, tournament_id: str) -> Optional[Dict]:
@@ -217,45 +584,34 @@ class DatabaseManager:
         try:
             # Only return mock data if no client exists
             if not self.client:
-                return {
-                    'id': tournament_id,
-                    'name': 'eFootball Solo Championship',
-                    'description': 'A mock solo tournament for development and testing',
-                    'sport': 'efootball',
-                    'format': 'single_elimination',
-                    'type': 'solo',
-                    'status': 'registration_open',
-                    'max_participants': 32,
-                    'max_teams': None,
-                    'max_players_per_team': None,
-                    'scoring_system': None,  # Solo tournaments don't have scoring systems
-                    'entry_fee': 0,
-                    'prize_pool': 500,
-                    'organizer_id': 'mock-organizer-123',
-                    'is_public': True,
-                    'location': 'Online',
-                    'rules': 'Standard eFootball rules apply',
-                    'created_at': datetime.now().isoformat(),
-                    'updated_at': datetime.now().isoformat()
-                }
+                from mock_data import MOCK_TOURNAMENT
+                return {**MOCK_TOURNAMENT, 'id': tournament_id}
+            
+            cache_key = self._cache_key('tournaments', tournament_id)
+            if self._is_known_missing(cache_key):
+                return None
             
             # Always query the database if client exists
-            response = self.client.table('tournaments').select('*').eq('id', tournament_id).execute()
-            return response.data[0] if response.data else None
+            tournament = self._get_one('tournaments', tournament_id)
+            if not tournament:
+                self._remember_missing(cache_key)
+            return tournament
         except Exception as e:
-            print(f"Error getting tournament: {e}")
+            log.exception("Error getting tournament")
             return None
     
     def update_tournament(self, tournament_id: str, data: Dict) -> Dict:
         """Update tournament data"""
         try:
-            data['updated_at'] = datetime.now().isoformat()
-            
             if not self.client:
                 return {'success': True, 'tournament': data}
             
             response = self.client.table('tournaments').update(data).eq('id', tournament_id).execute()
-            return {'success': True, 'tournament': response.data[0]}
+            self._invalidate('tournaments', tournament_id)
+            self._clear_tournament_details_cache(tournament_id)
+            tournament = response.data[0]
+            self._clear_user_tournaments_cache(tournament.get('organizer_id'))
+            return {'success': True, 'tournament': tournament}
         except Exception as e:
             return {'success': False, 'error': str(e)}
     
@@ -263,13 +619,13 @@ class DatabaseManager:
     def create_team(self, team_data: Dict) -> Dict:
         """Create a new team"""
         try:
-            team_data['id'] = str(uuid.uuid4())
-            team_data['created_at'] = datetime.now().isoformat()
-            
             if not self.client:
+                team_data['id'] = uuid.uuid4().hex
+                team_data['created_at'] = _now_iso()
                 return {'success': True, 'team': team_data}
             
             response = self.client.table('teams').insert(team_data).execute()
+            self._clear_tournament_details_cache(team_data.get('tournament_id'))
             return {'success': True, 'team': response.data[0]}
         except Exception as e:
             return {'success': False, 'error': str(e)}
@@ -280,42 +636,59 @@ class DatabaseManager:
             if not self.client:
                 return []
             
-            response = self.client.table('teams').select('*').eq('tournament_id', tournament_id).execute()
+            response = _execute_with_retry(self.client.table('teams').select('*').eq('tournament_id', tournament_id))
             return response.data
         except Exception as e:
-            print(f"Error getting teams: {e}")
+            log.exception("Error getting teams")
             return []
     
+    def count_teams(self, tournament_id: str) -> int:
+        """Number of teams registered in a tournament"""
+        try:
+            if not self.client:
+                return len(self.get_teams_by_tournament(tournament_id))
+            
+            return self._count_rows('teams', 'tournament_id', tournament_id)
+        except Exception as e:
+            log.exception("Error counting teams")
+            return 0
+    
+    def _team_value_taken(self, tournament_id: str, column: str, value: str) -> bool:
+        """Case-insensitive check for a team in the tournament already using this value"""
+        if not self.client:
+            return False
+        response = _execute_with_retry(self.client.table('teams').select('id').eq('tournament_id', tournament_id)
+                                       .ilike(column, _ilike_literal(value)).limit(1))
+        return bool(response.data)
+    
+    def _team_short_names_with_prefix(self, tournament_id: str, prefix: str) -> set:
+        """Upper-cased short names in the tournament that start with prefix"""
+        if not self.client:
+            return set()
+        response = _execute_with_retry(self.client.table('teams').select('short_name').eq('tournament_id', tournament_id)
+                                       .ilike('short_name', _ilike_literal(prefix) + '%'))
+        return {(team.get('short_name') or '').upper() for team in response.data}
+    
     def get_team_by_id(self, team_id: str) -> Optional[Dict]:
         """Get team by ID"""
         try:
             if not self.client:
-                return {
-                    'id': team_id,
-                    'name': 'Mock Team',
-                    'short_name': 'MOCK',
-                    'captain_name': 'Mock Captain',
-                    'captain_email': 'mock@example.com',
-                    'captain_phone': '123-456-7890',
-                    'is_approved': True,
-                    'created_at': datetime.now().isoformat()
-                }
+                from mock_data import MOCK_TEAM
+                return {**MOCK_TEAM, 'id': team_id}
             
-            response = self.client.table('teams').select('*').eq('id', team_id).execute()
-            return response.data[0] if response.data else None
+            return self._get_one('teams', team_id)
         except Exception as e:
-            print(f"Error getting team by ID: {e}")
+            log.exception("Error getting team by ID")
             return None
     
     def update_team(self, team_id: str, team_data: Dict) -> Dict:
         """Update team data"""
         try:
-            team_data['updated_at'] = datetime.now().isoformat()
-            
             if not self.client:
                 return {'success': True, 'team': team_data}
             
             response = self.client.table('teams').update(team_data).eq('id', team_id).execute()
+            self._invalidate('teams', team_id)
             return {'success': True, 'team': response.data[0]}
         except Exception as e:
             return {'success': False, 'error': str(e)}
@@ -326,7 +699,8 @@ class DatabaseManager:
             if not self.client:
                 return {'success': True, 'message': 'Team deleted successfully'}
             
-            response = self.client.table('teams').delete().eq('id', team_id).execute()
+            self.client.table('teams').delete(returning='minimal').eq('id', team_id).execute()
+            self._invalidate('teams', team_id)
             return {'success': True, 'message': 'Team deleted successfully'}
         except Exception as e:
             return {'success': False, 'error': str(e)}
@@ -335,10 +709,9 @@ class DatabaseManager:
     def create_player(self, player_data: Dict) -> Dict:
         """Create a new player"""
         try:
-            player_data['id'] = str(uuid.uuid4())
-            player_data['created_at'] = datetime.now().isoformat()
-            
             if not self.client:
+                player_data['id'] = uuid.uuid4().hex
+                player_data['created_at'] = _now_iso()
                 return {'success': True, 'player': player_data}
             
             response = self.client.table('players').insert(player_data).execute()
@@ -351,76 +724,46 @@ class DatabaseManager:
         try:
             if not self.client:
                 # Return mock players for development mode
-                return [
-                    {
-                        'id': 'mock-player-1',
-                        'team_id': team_id,
-                        'name': 'Alex Rodriguez',
-                        'jersey_number': 10,
-                        'position': 'Forward',
-                        'email': 'alex@example.com'
-                    },
-                    {
-                        'id': 'mock-player-2',
-                        'team_id': team_id,
-                        'name': 'Maria Santos',
-                        'jersey_number': 7,
-                        'position': 'Midfielder',
-                        'email': 'maria@example.com'
-                    },
-                    {
-                        'id': 'mock-player-3',
-                        'team_id': team_id,
-                        'name': 'David Kim',
-                        'jersey_number': 9,
-                        'position': 'Forward',
-                        'email': 'david@example.com'
-                    },
-                    {
-                        'id': 'mock-player-4',
-                        'team_id': team_id,
-                        'name': 'Sarah Johnson',
-                        'jersey_number': 11,
-                        'position': 'Midfielder',
-                        'email': 'sarah@example.com'
-                    }
-                ]
-            
-            response = self.client.table('players').select('*').eq('team_id', team_id).execute()
+                from mock_data import MOCK_TEAM_PLAYERS
+                return [{**player, 'team_id': team_id} for player in MOCK_TEAM_PLAYERS]
+            
+            response = _execute_with_retry(self.client.table('players').select('*').eq('team_id', team_id))
             return response.data
         except Exception as e:
-            print(f"Error getting players: {e}")
+            log.exception("Error getting players")
             return []
     
     def get_player_by_id(self, player_id: str) -> Optional[Dict]:
         """Get player by ID"""
         try:
             if not self.client:
-                return {
-                    'id': player_id,
-                    'name': 'Mock Player',
-                    'jersey_number': 1,
-                    'position': 'Forward',
-                    'email': 'mock@example.com',
-                    'phone': '123-456-7890',
-                    'created_at': datetime.now().isoformat()
-                }
+                from mock_data import MOCK_PLAYER
+                return {**MOCK_PLAYER, 'id': player_id}
             
-            response = self.client.table('players').select('*').eq('id', player_id).execute()
-            return response.data[0] if response.data else None
+            return self._get_one('players', player_id)
         except Exception as e:
-            print(f"Error getting player by ID: {e}")
+            log.exception("Error getting player by ID")
             return None
     
+    def get_players_by_ids(self, player_ids, columns: str = '*') -> Dict[str, Dict]:
+        """Get several players in one query, keyed by ID"""
+        try:
+            if not self.client:
+                return {player_id: self.get_player_by_id(player_id) for player_id in player_ids if player_id}
+            
+            return self._get_by_ids('players', player_ids, columns)
+        except Exception as e:
+            log.exception("Error getting players by IDs")
+            return {}
+    
     def update_player(self, player_id: str, player_data: Dict) -> Dict:
         """Update player data"""
         try:
-            player_data['updated_at'] = datetime.now().isoformat()
-            
             if not self.client:
                 return {'success': True, 'player': player_data}
             
             response = self.client.table('players').update(player_data).eq('id', player_id).execute()
+            self._invalidate('players', player_id)
             return {'success': True, 'player': response.data[0]}
         except Exception as e:
             return {'success': False, 'error': str(e)}
@@ -431,7 +774,8 @@ class DatabaseManager:
             if not self.client:
                 return {'success': True, 'message': 'Player deleted successfully'}
             
-            response = self.client.table('players').delete().eq('id', player_id).execute()
+            self.client.table('players').delete(returning='minimal').eq('id', player_id).execute()
+            self._invalidate('players', player_id)
             return {'success': True, 'message': 'Player deleted successfully'}
         except Exception as e:
             return {'success': False, 'error': str(e)}
@@ -440,16 +784,30 @@ class DatabaseManager:
     def create_participant(self, participant_data: Dict) -> Dict:
         """Create a new participant for solo tournaments"""
         try:
-            participant_data['id'] = str(uuid.uuid4())
-            participant_data['created_at'] = datetime.now().isoformat()
             participant_data['status'] = 'active'
             
             if not self.client:
+                participant_data['id'] = uuid.uuid4().hex
+                participant_data['created_at'] = _now_iso()
                 return {'success': True, 'participant': participant_data}
             
-            response = self.client.table('participants').insert(participant_data).execute()
+            # Emails are stored lower-cased so the unique key is case-insensitive; blank becomes NULL
+            participant_data['email'] = _normalize_email(participant_data.get('email'))
+            
+            # The (tournament_id, email) unique key does the duplicate check; a conflict returns no row
+            response = self.client.table('participants').upsert(
+                participant_data, on_conflict='tournament_id,email', ignore_duplicates=True
+            ).execute()
+            if not response.data:
+                return {'success': False, 'error': 'This email address is already registered for this tournament'}
+            
+            self._invalidate('participants', email=f"{participant_data.get('tournament_id')}:{participant_data.get('email')}")
+            self._clear_tournament_details_cache(participant_data.get('tournament_id'))
             return {'success': True, 'participant': response.data[0]}
         except Exception as e:
+            if '23505' in str(e):
+                # Matched a legacy mixed-case row through the lower(email) index
+                return {'success': False, 'error': 'This email address is already registered for this tournament'}
             return {'success': False, 'error': str(e)}
     
     def get_participants_by_tournament(self, tournament_id: str) -> List[Dict]:
@@ -458,73 +816,57 @@ class DatabaseManager:
             # Only return mock data if no client exists
             if not self.client:
                 # Return mock participants for development/testing
-                return [
-                    {
-                        'id': 'mock-participant-1',
-                        'name': 'John Doe',
-                        'email': 'john@example.com',
-                        'gamer_tag': 'JohnGamer',
-                        'tournament_id': tournament_id,
-                        'status': 'active',
-                        'created_at': '2024-12-09T10:00:00Z'
-                    },
-                    {
-                        'id': 'mock-participant-2',
-                        'name': 'Jane Smith', 
-                        'email': 'jane@example.com',
-                        'gamer_tag': 'JanePlayer',
-                        'tournament_id': tournament_id,
-                        'status': 'active',
-                        'created_at': '2024-12-09T11:00:00Z'
-                    },
-                    {
-                        'id': 'mock-participant-3',
-                        'name': 'Mike Wilson',
-                        'email': 'mike@example.com', 
-                        'gamer_tag': 'MikeChamp',
-                        'tournament_id': tournament_id,
-                        'status': 'active',
-                        'created_at': '2024-12-09T12:00:00Z'
-                    }
-                ]
+                from mock_data import MOCK_PARTICIPANTS
+                return [{**participant, 'tournament_id': tournament_id} for participant in MOCK_PARTICIPANTS]
             
             # Always query the database if client exists
-            response = self.client.table('participants').select('*').eq('tournament_id', tournament_id).execute()
-            return response.data
+            return list(self.iter_participants_by_tournament(tournament_id))
         except Exception as e:
-            print(f"Error getting participants: {e}")
+            log.exception("Error getting participants")
             return []
     
+    def count_participants(self, tournament_id: str) -> int:
+        """Number of participants registered in a tournament"""
+        try:
+            if not self.client:
+                return len(self.get_participants_by_tournament(tournament_id))
+            
+            return self._count_rows('participants', 'tournament_id', tournament_id)
+        except Exception as e:
+            log.exception("Error counting participants")
+            return 0
+    
+    def iter_participants_by_tournament(self, tournament_id: str, chunk: int = 200):
+        """Iterate over a tournament's participants in registration order, a page at a time"""
+        if not self.client:
+            yield from self.get_participants_by_tournament(tournament_id)
+            return
+        
+        yield from self._iter_pages(
+            lambda: self.client.table('participants').select('*').eq('tournament_id', tournament_id).order('created_at,id'),
+            chunk
+        )
+    
     def get_participant_by_id(self, participant_id: str) -> Optional[Dict]:
         """Get participant by ID"""
         try:
             if not self.client:
-                return {
-                    'id': participant_id,
-                    'name': 'Mock Participant',
-                    'email': 'mock@example.com',
-                    'phone': '123-456-7890',
-                    'gamer_tag': 'MockGamer',
-                    'skill_level': 'Intermediate',
-                    'status': 'active',
-                    'created_at': datetime.now().isoformat()
-                }
+                from mock_data import MOCK_PARTICIPANT
+                return {**MOCK_PARTICIPANT, 'id': participant_id}
             
-            response = self.client.table('participants').select('*').eq('id', participant_id).execute()
-            return response.data[0] if response.data else None
+            return self._get_one('participants', participant_id)
         except Exception as e:
-            print(f"Error getting participant by ID: {e}")
+            log.exception("Error getting participant by ID")
             return None
     
     def update_participant(self, participant_id: str, participant_data: Dict) -> Dict:
         """Update participant data"""
         try:
-            participant_data['updated_at'] = datetime.now().isoformat()
-            
             if not self.client:
                 return {'success': True, 'participant': participant_data}
             
             response = self.client.table('participants').update(participant_data).eq('id', participant_id).execute()
+            self._invalidate('participants', participant_id)
             return {'success': True, 'participant': response.data[0]}
         except Exception as e:
             return {'success': False, 'error': str(e)}
@@ -535,7 +877,8 @@ class DatabaseManager:
             if not self.client:
                 return {'success': True, 'message': 'Participant deleted successfully'}
             
-            response = self.client.table('participants').delete().eq('id', participant_id).execute()
+            self.client.table('participants').delete(returning='minimal').eq('id', participant_id).execute()
+            self._invalidate('participants', participant_id)
             return {'success': True, 'message': 'Participant deleted successfully'}
         except Exception as e:
             return {'success': False, 'error': str(e)}
@@ -546,21 +889,29 @@ class DatabaseManager:
             if not self.client:
                 return None
             
-            response = self.client.table('participants').select('*').eq('tournament_id', tournament_id).eq('email', email).execute()
-            return response.data[0] if response.data else None
+            email = _normalize_email(email)
+            cache_key = self._cache_key('participants', f'email:{tournament_id}:{email}')
+            if self._is_known_missing(cache_key):
+                return None
+            
+            response = _execute_with_retry(self.client.table('participants').select('*').eq('tournament_id', tournament_id).eq('email', email))
+            if not response.data:
+                self._remember_missing(cache_key)
+                return None
+            return response.data[0]
         except Exception as e:
-            print(f"Error checking participant by email: {e}")
+            log.exception("Error checking participant by email")
             return None
     
     # Match operations
     def create_match(self, match_data: Dict) -> Dict:
         """Create a new match"""
         try:
-            match_data['id'] = str(uuid.uuid4())
-            match_data['created_at'] = datetime.now().isoformat()
             match_data['status'] = 'scheduled'
             
             if not self.client:
+                match_data['id'] = uuid.uuid4().hex
+                match_data['created_at'] = _now_iso()
                 return {'success': True, 'match': match_data}
             
             response = self.client.table('matches').insert(match_data).execute()
@@ -568,94 +919,88 @@ class DatabaseManager:
         except Exception as e:
             return {'success': False, 'error': str(e)}
     
+    def create_matches_batch(self, matches_data: List[Dict]) -> Dict:
+        """Create multiple matches in a single insert"""
+        try:
+            for match_data in matches_data:
+                match_data['status'] = 'scheduled'
+            
+            if not self.client:
+                now = _now_iso()
+                for match_data in matches_data:
+                    match_data['id'] = uuid.uuid4().hex
+                    match_data['created_at'] = now
+                return {'success': True, 'matches': matches_data, 'count': len(matches_data)}
+            
+            response = self.client.table('matches').insert(matches_data).execute()
+            return {'success': True, 'matches': response.data, 'count': len(response.data)}
+        except Exception as e:
+            return {'success': False, 'error': str(e)}
+    
     def get_matches_by_tournament(self, tournament_id: str) -> List[Dict]:
         """Get all matches in a tournament"""
         try:
             if not self.client:
                 return []
             
-            response = self.client.table('matches').select('*').eq('tournament_id', tournament_id).execute()
-            return response.data
+            return list(self.iter_matches_by_tournament(tournament_id))
         except Exception as e:
-            print(f"Error getting matches: {e}")
+            log.exception("Error getting matches")
             return []
     
+    def iter_matches_by_tournament(self, tournament_id: str, chunk: int = 200):
+        """Iterate over a tournament's matches in fixture order, a page at a time"""
+        if not self.client:
+            return
+        
+        yield from self._iter_pages(
+            lambda: self.client.table('matches').select('*').eq('tournament_id', tournament_id).order('created_at,match_number,id'),
+            chunk
+        )
+    
     def get_solo_matches_by_tournament(self, tournament_id: str) -> List[Dict]:
         """Get all solo matches in a tournament"""
         try:
             # Only return mock data if no client exists at all
             if not self.client:
                 # Return mock solo matches for development/testing when no database
-                return [
-                    {
-                        'id': 'mock-solo-match-1',
-                        'tournament_id': tournament_id,
-                        'participant1_id': 'mock-participant-1',
-                        'participant2_id': 'mock-participant-2',
-                        'participant1_score': 2,
-                        'participant2_score': 1,
-                        'status': 'completed',
-                        'winner_id': 'mock-participant-1',
-                        'round': 1,
-                        'created_at': '2024-12-09T14:00:00Z'
-                    },
-                    {
-                        'id': 'mock-solo-match-2',
-                        'tournament_id': tournament_id,
-                        'participant1_id': 'mock-participant-3',
-                        'participant2_id': 'mock-participant-1',
-                        'participant1_score': None,
-                        'participant2_score': None,
-                        'status': 'scheduled',
-                        'winner_id': None,
-                        'round': 1,
-                        'created_at': '2024-12-09T15:00:00Z'
-                    }
-                ]
+                from mock_data import MOCK_SOLO_MATCHES
+                return [{**match, 'tournament_id': tournament_id} for match in MOCK_SOLO_MATCHES]
             
             # Always query the database if client exists
-            response = self.client.table('solo_matches').select('*').eq('tournament_id', tournament_id).execute()
+            response = _execute_with_retry(self.client.table('solo_matches').select(_SOLO_MATCH_COLUMNS).eq('tournament_id', tournament_id))
             return response.data
         except Exception as e:
-            print(f"Error getting solo matches: {e}")
+            log.exception("Error getting solo matches")
             return []
     
     def get_match_by_id(self, match_id: str) -> Optional[Dict]:
         """Get match by ID"""
         try:
             if not self.client:
-                return {
-                    'id': match_id,
-                    'team1_id': 'mock-team-1',
-                    'team2_id': 'mock-team-2',
-                    'status': 'scheduled',
-                    'team1_score': 0,
-                    'team2_score': 0,
-                    'team1_player_goals': None,
-                    'team2_player_goals': None,
-                    'team1_player_id': None,
-                    'team2_player_id': None,
-                    'venue': '',
-                    'notes': '',
-                    'referee': '',
-                    'created_at': datetime.now().isoformat()
-                }
+                from mock_data import MOCK_MATCH
+                return {**MOCK_MATCH, 'id': match_id}
+            
+            cache_key = self._cache_key('matches', match_id)
+            if self._is_known_missing(cache_key):
+                return None
             
-            response = self.client.table('matches').select('*').eq('id', match_id).execute()
-            return response.data[0] if response.data else None
+            match = self._get_one('matches', match_id)
+            if not match:
+                self._remember_missing(cache_key)
+            return match
         except Exception as e:
-            print(f"Error getting match by ID: {e}")
+            log.exception("Error getting match by ID")
             return None
     
     def update_match_score(self, match_id: str, score_data: Dict) -> Dict:
         """Update match score and status"""
         try:
-            score_data['updated_at'] = datetime.now().isoformat()
-            
             if not self.client:
                 return {'success': True, 'match': score_data}
             
             response = self.client.table('matches').update(score_data).eq('id', match_id).execute()
+            self._invalidate('matches', match_id)
             return {'success': True, 'match': response.data[0]}
         except Exception as e:
             return {'success': False, 'error': str(e)}
@@ -663,13 +1008,13 @@ class DatabaseManager:
     def create_solo_match(self, match_data: Dict) -> Dict:
         """Create a new solo match"""
         try:
-            match_data['id'] = str(uuid.uuid4())
-            match_data['created_at'] = datetime.now().isoformat()
             if 'status' not in match_data:
                 match_data['status'] = 'scheduled'
             
             # Only return mock response if no client exists at all
             if not self.client:
+                match_data['id'] = uuid.uuid4().hex
+                match_data['created_at'] = _now_iso()
                 return {'success': True, 'match': match_data}
             
             # Always try to save to database if client exists
@@ -678,40 +1023,45 @@ class DatabaseManager:
         except Exception as e:
             return {'success': False, 'error': str(e)}
     
+    def create_solo_matches_batch(self, matches_data: List[Dict]) -> Dict:
+        """Create multiple solo matches in a single insert"""
+        try:
+            for match_data in matches_data:
+                match_data.setdefault('status', 'scheduled')
+            
+            if not self.client:
+                now = _now_iso()
+                for match_data in matches_data:
+                    match_data['id'] = uuid.uuid4().hex
+                    match_data['created_at'] = now
+                return {'success': True, 'matches': matches_data, 'count': len(matches_data)}
+            
+            response = self.client.table('solo_matches').insert(matches_data).execute()
+            return {'success': True, 'matches': response.data, 'count': len(response.data)}
+        except Exception as e:
+            return {'success': False, 'error': str(e)}
+    
     def get_solo_match_by_id(self, match_id: str) -> Optional[Dict]:
         """Get solo match by ID"""
         try:
             if not self.client:
                 # Return mock solo match for development
-                return {
-                    'id': match_id,
-                    'tournament_id': 'mock-tournament-123',
-                    'participant1_id': 'mock-participant-1',
-                    'participant2_id': 'mock-participant-2',
-                    'participant1_score': None,
-                    'participant2_score': None,
-                    'status': 'scheduled',
-                    'winner_id': None,
-                    'round': 1,
-                    'match_date': None,
-                    'created_at': datetime.now().isoformat()
-                }
+                from mock_data import MOCK_SOLO_MATCH
+                return {**MOCK_SOLO_MATCH, 'id': match_id}
             
-            response = self.client.table('solo_matches').select('*').eq('id', match_id).execute()
-            return response.data[0] if response.data else None
+            return self._get_one('solo_matches', match_id)
         except Exception as e:
-            print(f"Error getting solo match by ID: {e}")
+            log.exception("Error getting solo match by ID")
             return None
     
     def update_solo_match(self, match_id: str, match_data: Dict) -> Dict:
         """Update solo match data"""
         try:
-            match_data['updated_at'] = datetime.now().isoformat()
-            
             if not self.client:
                 return {'success': True, 'match': match_data}
             
             response = self.client.table('solo_matches').update(match_data).eq('id', match_id).execute()
+            self._invalidate('solo_matches', match_id)
             return {'success': True, 'match': response.data[0] if response.data else match_data}
         except Exception as e:
             return {'success': False, 'error': str(e)}
@@ -722,7 +1072,8 @@ class DatabaseManager:
             if not self.client:
                 return {'success': True, 'message': 'Solo match deleted successfully'}
             
-            response = self.client.table('solo_matches').delete().eq('id', match_id).execute()
+            self.client.table('solo_matches').delete(returning='minimal').eq('id', match_id).execute()
+            self._invalidate('solo_matches', match_id)
             return {'success': True, 'message': 'Solo match deleted successfully'}
         except Exception as e:
             return {'success': False, 'error': str(e)}
@@ -731,91 +1082,78 @@ class DatabaseManager:
         """Get all tournaments for statistics (admin/platform level)"""
         try:
             if not self.client:
-                # Return mock data for development with realistic numbers
-                return [
-                    {
-                        'id': f'mock-tournament-{i}',
-                        'name': f'Tournament {i}',
-                        'type': 'solo' if i % 2 == 0 else 'team',
-                        'status': 'completed' if i < 800 else ('in_progress' if i < 850 else 'registration_open'),
-                        'created_at': datetime.now().isoformat(),
-                        'organizer_id': f'user-{i % 100}'
-                    } for i in range(1, 1001)
-                ]
-            
-            response = self.client.table('tournaments').select('*').limit(limit).execute()
+                from mock_data import MOCK_ALL_TOURNAMENTS
+                return list(MOCK_ALL_TOURNAMENTS)
+            
+            response = _execute_with_retry(self.client.table('tournaments').select('*').limit(limit))
+            return response.data
+        except Exception as e:
+            log.exception("Error getting all tournaments")
+            return []
+    
+    def get_tournament_stats(self) -> List[Dict]:
+        """Tournament and participant counts per (type, status), aggregated by the tournament_stats_v view"""
+        try:
+            if not self.client:
+                from mock_data import MOCK_ALL_TOURNAMENTS, MOCK_PARTICIPANTS
+                counts = {}
+                for tournament in MOCK_ALL_TOURNAMENTS:
+                    key = (tournament['type'], tournament['status'])
+                    count, participants = counts.get(key, (0, 0))
+                    solo_participants = len(MOCK_PARTICIPANTS) if tournament['type'] == 'solo' else 0
+                    counts[key] = (count + 1, participants + solo_participants)
+                return [{'type': t, 'status': st, 'count': n, 'participants': p}
+                        for (t, st), (n, p) in counts.items()]
+            
+            response = _execute_with_retry(self.client.table('tournament_stats_v').select('type,status,count,participants'))
+            return response.data
+        except Exception as e:
+            log.exception("Error getting tournament stats")
+            return []
+    
+    def get_player_rankings(self) -> List[Dict]:
+        """Per-player totals across completed solo tournaments, aggregated by the player_rankings_v view"""
+        try:
+            if not self.client:
+                return []
+            
+            response = _execute_with_retry(self.client.table('player_rankings_v').select('*'))
             return response.data
         except Exception as e:
-            print(f"Error getting all tournaments: {e}")
+            log.exception("Error getting player rankings")
             return []
     
     # Public tournament access methods
+    def _enrich_tournament(self, tournament: Dict) -> Dict:
+        """Add participant/team count and organizer name to a tournament row in place"""
+        # participants(count) embeds as [{'count': n}]; PostgREST does the counting
+        if tournament['type'] == 'solo':
+            tournament['participant_count'] = _embedded_count(tournament, 'participants')
+        else:
+            tournament['team_count'] = _embedded_count(tournament, 'teams')
+        
+        if tournament.get('users'):
+            tournament['organizer_name'] = tournament['users']['full_name']
+        return tournament
+    
     def get_public_tournaments(self, limit: int = 50) -> List[Dict]:
         """Get all public tournaments available for registration"""
         try:
             if not self.client:
-                # Return mock data for development
-                return [
-                    {
-                        'id': 'mock-tournament-1',
-                        'name': 'eFootball Championship 2024',
-                        'description': 'Annual eFootball tournament for all skill levels',
-                        'type': 'solo',
-                        'format': 'single_elimination',
-                        'status': 'registration_open',
-                        'max_participants': 32,
-                        'registration_deadline': '2024-12-31T23:59:59',
-                        'start_date': '2025-01-15T18:00:00',
-                        'entry_fee': 0,
-                        'prize_pool': 1000,
-                        'organizer_name': 'Tournament Admin',
-                        'created_at': datetime.now().isoformat(),
-                        'participant_count': 12
-                    },
-                    {
-                        'id': 'mock-tournament-2', 
-                        'name': 'Team eFootball League',
-                        'description': 'Professional team competition',
-                        'type': 'team',
-                        'format': 'round_robin',
-                        'status': 'registration_open',
-                        'max_teams': 16,
-                        'registration_deadline': '2024-12-25T23:59:59',
-                        'start_date': '2025-01-10T19:00:00',
-                        'entry_fee': 50,
-                        'prize_pool': 5000,
-                        'organizer_name': 'Pro League',
-                        'created_at': datetime.now().isoformat(),
-                        'team_count': 8
-                    }
-                ]
+                from mock_data import MOCK_PUBLIC_TOURNAMENTS
+                return [dict(tournament) for tournament in MOCK_PUBLIC_TOURNAMENTS]
             
             # Query public tournaments with participant counts
-            response = self.client.table('tournaments').select(
+            response = _execute_with_retry(self.client.table('tournaments').select(
                 '*,'
                 'participants(count),'
                 'teams(count),'
                 'users!tournaments_organizer_id_fkey(full_name)'
-            ).in_('status', ['registration_open', 'in_progress', 'draft']).limit(limit).execute()
-            
-            tournaments = []
-            for tournament in response.data:
-                tournament_data = tournament.copy()
-                # Add participant/team counts
-                if tournament['type'] == 'solo':
-                    tournament_data['participant_count'] = len(tournament.get('participants', []))
-                else:
-                    tournament_data['team_count'] = len(tournament.get('teams', []))
-                
-                # Add organizer name
-                if tournament.get('users'):
-                    tournament_data['organizer_name'] = tournament['users']['full_name']
-                
-                tournaments.append(tournament_data)
+            ).in_('status', ['registration_open', 'in_progress', 'draft']).limit(limit))
             
-            return tournaments
+            return [self._enrich_tournament(tournament) for tournament in response.data]
         except Exception as e:
-            print(f"Error getting public tournaments: {e}")
+            log.exception("Error getting public tournaments")
             return []
     
     def get_public_tournament_details(self, tournament_id: str) -> Optional[Dict]:
@@ -839,18 +1177,24 @@ class DatabaseManager:
                     'rules': 'Standard eFootball rules apply. Best of 3 matches in elimination rounds.',
                     'organizer_name': 'Tournament Admin',
                     'organizer_email': 'admin@tournament.com',
-                    'created_at': datetime.now().isoformat(),
+                    'created_at': _now_iso(),
                     'participant_count': 12,
                     'participants': []
                 }
             
+            # Served from a short-TTL cache; copies, since pages annotate the dict
+            cache_key = self._cache_key('tournament_details', tournament_id)
+            cached = self._get_from_cache(cache_key, self._details_cache)
+            if cached:
+                return dict(cached)
+            
             # Get tournament with full details
-            response = self.client.table('tournaments').select(
+            response = _execute_with_retry(self.client.table('tournaments').select(
                 '*,'
                 'participants(*),'
                 'teams(*),'
                 'users!tournaments_organizer_id_fkey(full_name,email)'
-            ).eq('id', tournament_id).execute()
+            ).eq('id', tournament_id))
             
             if not response.data:
                 return None
@@ -867,42 +1211,60 @@ class DatabaseManager:
                 tournament['organizer_name'] = tournament['users']['full_name']
                 tournament['organizer_email'] = tournament['users']['email']
             
-            return tournament
+            self._set_cache(cache_key, tournament, self._details_cache)
+            return dict(tournament)
         except Exception as e:
-            print(f"Error getting tournament details: {e}")
+            log.exception("Error getting tournament details")
             return None
     
+    def get_tournaments_by_ids(self, tournament_ids) -> Dict[str, Dict]:
+        """Fetch several tournaments (own columns only) in one query, keyed by ID"""
+        try:
+            if not self.client:
+                return {tid: self.get_public_tournament_details(tid) for tid in set(tournament_ids) if tid}
+            
+            return self._get_by_ids('tournaments', tournament_ids)
+        except Exception as e:
+            log.exception("Error getting tournaments by IDs")
+            return {}
+    
+    def _get_tournament_registration_snapshot(self, tournament_id: str) -> Optional[Dict]:
+        """Just the fields registration checks: status, type, deadline and capacity counts"""
+        if not self.client:
+            return self.get_public_tournament_details(tournament_id)
+        
+        response = _execute_with_retry(self.client.table('tournaments').select(
+            'id,status,type,max_participants,max_teams,registration_deadline,participants(count),teams(count)'
+        ).eq('id', tournament_id).maybe_single())
+        tournament = response.data if response else None
+        if tournament:
+            tournament['participant_count'] = _embedded_count(tournament, 'participants')
+            tournament['team_count'] = _embedded_count(tournament, 'teams')
+        return tournament
+    
     def register_for_tournament(self, tournament_id: str, registration_data: Dict) -> Dict:
         """Register a participant for a tournament with comprehensive validation"""
         try:
             # Get tournament first to check type and capacity
-            tournament = self.get_public_tournament_details(tournament_id)
+            tournament = self._get_tournament_registration_snapshot(tournament_id)
             if not tournament:
                 return {'success': False, 'error': 'Tournament not found or no longer available'}
             
             if tournament['status'] != 'registration_open':
-                status_messages = {
-                    'draft': 'Registration has not started yet for this tournament',
-                    'in_progress': 'Registration is closed - tournament has already started',
-                    'completed': 'This tournament has already ended',
-                    'cancelled': 'This tournament has been cancelled'
-                }
-                message = status_messages.get(tournament['status'], 'Registration is not currently open')
+                message = _REGISTRATION_STATUS_MESSAGES.get(tournament['status'], 'Registration is not currently open')
                 return {'success': False, 'error': message}
             
             # Check registration deadline
             if tournament.get('registration_deadline'):
-                from datetime import datetime
                 deadline = datetime.fromisoformat(tournament['registration_deadline'].replace('Z', '+00:00'))
-                if datetime.now() > deadline:
+                if deadline.tzinfo is None:
+                    deadline = deadline.replace(tzinfo=timezone.utc)
+                if datetime.now(timezone.utc) > deadline:
                     return {'success': False, 'error': 'Registration deadline has passed'}
             
             # Handle solo tournament registration
             if tournament['type'] == 'solo':
-                # Check for duplicate registration
-                existing = self.get_participant_by_email(tournament_id, registration_data['email'])
-                if existing:
-                    return {'success': False, 'error': 'This email address is already registered for this tournament'}
+                # Duplicate emails are rejected by create_participant's upsert
                 
                 # Check capacity with more specific message
                 current_count = tournament.get('participant_count', 0)
@@ -919,7 +1281,7 @@ class DatabaseManager:
                     'psn_id': registration_data.get('psn_id', ''),
                     'skill_level': registration_data.get('skill_level', 'beginner'),
                     'status': 'registered',
-                    'registration_date': datetime.now().isoformat()
+                    'registration_date': _now_iso()
                 }
                 result = self.create_participant(participant_data)
                 if result.get('success'):
@@ -927,15 +1289,12 @@ class DatabaseManager:
                 return result
             
             else:  # team tournament
-                # Check for duplicate team name (case-insensitive)
-                existing_teams = self.get_teams_by_tournament(tournament_id)
-                team_names = [team['name'].lower().strip() for team in existing_teams]
-                if registration_data['team_name'].lower().strip() in team_names:
+                # Duplicate checks are indexed lookups; the unique indexes also catch concurrent registrations
+                if self._team_value_taken(tournament_id, 'name', registration_data['team_name'].strip()):
                     return {'success': False, 'error': 'A team with this name is already registered. Please choose a different team name'}
                 
                 # Check for duplicate captain email
-                captain_emails = [team.get('captain_email', '').lower() for team in existing_teams if team.get('captain_email')]
-                if registration_data['email'].lower() in captain_emails:
+                if self._team_value_taken(tournament_id, 'captain_email', registration_data['email']):
                     return {'success': False, 'error': 'This email address is already registered as a team captain'}
                 
                 # Check capacity with more specific message
@@ -945,15 +1304,11 @@ class DatabaseManager:
                     return {'success': False, 'error': f'Tournament is full ({max_teams} teams maximum)'}
                 
                 # Validate short name uniqueness
-                short_names = [team.get('short_name', '').upper() for team in existing_teams]
                 proposed_short_name = registration_data.get('short_name', registration_data['team_name'][:4]).upper()
-                if proposed_short_name in short_names:
+                if self._team_value_taken(tournament_id, 'short_name', proposed_short_name):
                     # Auto-generate unique short name
                     base_name = registration_data['team_name'][:3].upper()
-                    counter = 1
-                    while f"{base_name}{counter}" in short_names:
-                        counter += 1
-                    proposed_short_name = f"{base_name}{counter}"
+                    proposed_short_name = _next_short_name(base_name, self._team_short_names_with_prefix(tournament_id, base_name))
                 
                 # Create team with enhanced data
                 team_data = {
@@ -965,9 +1320,12 @@ class DatabaseManager:
                     'captain_phone': registration_data.get('phone', ''),
                     'is_approved': True,  # Auto-approve for public registration
                     'status': 'registered',
-                    'registration_date': datetime.now().isoformat()
+                    'registration_date': _now_iso()
                 }
                 result = self.create_team(team_data)
+                if not result.get('success') and '23505' in result.get('error', ''):
+                    # Lost a race with a concurrent registration for the same name, email or tag
+                    return {'success': False, 'error': 'A team with this name, captain email or tag was just registered. Please check your details and try again'}
                 if result.get('success'):
                     result['message'] = f'Successfully registered! You are team #{current_count + 1} of {max_teams}'
                     if proposed_short_name != registration_data.get('short_name', ''):
@@ -975,17 +1333,14 @@ class DatabaseManager:
                 return result
                 
         except Exception as e:
-            print(f"Error registering for tournament: {e}")
+            log.exception("Error registering for tournament")
             return {'success': False, 'error': 'Registration failed due to a technical error. Please try again'}
 
     # Sub-matches operations for multi-match team tournaments
     def create_sub_match(self, sub_match_data: Dict) -> Dict:
         """Create a new sub-match"""
         try:
-            sub_match_data['id'] = str(uuid.uuid4())
-            sub_match_data['created_at'] = datetime.now().isoformat()
-            if 'status' not in sub_match_data:
-                sub_match_data['status'] = 'scheduled'
+            self._prep_sub_match(sub_match_data, _now_iso(), uuid.uuid4().hex)
             
             if not self.client:
                 return {'success': True, 'sub_match': sub_match_data}
@@ -995,69 +1350,65 @@ class DatabaseManager:
         except Exception as e:
             return {'success': False, 'error': str(e)}
     
-    def create_sub_matches_batch(self, sub_matches_data: List[Dict]) -> Dict:
+    def _prep_sub_match(self, sub_match_data: Dict, now: str, sub_match_id: str) -> Dict:
+        """Set the ID, timestamp and default status on a new sub-match row in place"""
+        sub_match_data['id'] = sub_match_id
+        sub_match_data['created_at'] = now
+        sub_match_data.setdefault('status', 'scheduled')
+        return sub_match_data
+    
+    def _prep_sub_matches(self, sub_matches_data: List[Dict]) -> List[Dict]:
+        """Add IDs, timestamps and default status to new sub-match rows"""
+        now = _now_iso()
+        for sub_match_data, sub_match_id in zip(sub_matches_data, _new_ids(len(sub_matches_data))):
+            self._prep_sub_match(sub_match_data, now, sub_match_id)
+        return sub_matches_data
+    
+    def create_sub_matches_batch(self, sub_matches_data: List[Dict], return_rows: bool = True) -> Dict:
         """Create multiple sub-matches in a batch operation"""
         try:
-            # Add IDs and timestamps to all records
-            for sub_match_data in sub_matches_data:
-                sub_match_data['id'] = str(uuid.uuid4())
-                sub_match_data['created_at'] = datetime.now().isoformat()
-                if 'status' not in sub_match_data:
-                    sub_match_data['status'] = 'scheduled'
+            self._prep_sub_matches(sub_matches_data)
             
             if not self.client:
                 return {'success': True, 'sub_matches': sub_matches_data, 'count': len(sub_matches_data)}
             
+            if not return_rows:
+                # Prefer: return=minimal; the caller only needs to know the insert went through
+                self.client.table('sub_matches').insert(sub_matches_data, returning='minimal').execute()
+                return {'success': True, 'sub_matches': [], 'count': len(sub_matches_data)}
+            
             response = self.client.table('sub_matches').insert(sub_matches_data).execute()
             return {'success': True, 'sub_matches': response.data, 'count': len(response.data)}
         except Exception as e:
             return {'success': False, 'error': str(e)}
     
+    def replace_sub_matches(self, parent_match_id: str, sub_matches_data: List[Dict]) -> Dict:
+        """Atomically replace a match's sub-matches (and clear its match participants) in one call"""
+        try:
+            self._prep_sub_matches(sub_matches_data)
+            
+            if not self.client:
+                return {'success': True, 'count': len(sub_matches_data)}
+            
+            response = self.client.rpc('replace_sub_matches', {
+                'p_parent_match_id': parent_match_id,
+                'p_sub_matches': sub_matches_data
+            }).execute()
+            return {'success': True, 'count': response.data}
+        except Exception as e:
+            return {'success': False, 'error': str(e)}
+    
     def get_sub_matches_by_parent_match(self, parent_match_id: str) -> List[Dict]:
         """Get all sub-matches for a parent match"""
         try:
             if not self.client:
-                # Return mock sub-matches for development
-                return [
-                    {
-                        'id': 'mock-sub-match-1',
-                        'parent_match_id': parent_match_id,
-                        'team1_player_id': 'mock-player-1',
-                        'team2_player_id': 'mock-player-2',
-                        'team1_player_goals': 2,
-                        'team2_player_goals': 1,
-                        'match_order': 1,
-                        'status': 'completed',
-                        'winner_id': 'mock-player-1'
-                    },
-                    {
-                        'id': 'mock-sub-match-2',
-                        'parent_match_id': parent_match_id,
-                        'team1_player_id': 'mock-player-3',
-                        'team2_player_id': 'mock-player-4',
-                        'team1_player_goals': 1,
-                        'team2_player_goals': 3,
-                        'match_order': 2,
-                        'status': 'completed',
-                        'winner_id': 'mock-player-4'
-                    },
-                    {
-                        'id': 'mock-sub-match-3',
-                        'parent_match_id': parent_match_id,
-                        'team1_player_id': 'mock-player-1',
-                        'team2_player_id': 'mock-player-4',
-                        'team1_player_goals': None,
-                        'team2_player_goals': None,
-                        'match_order': 3,
-                        'status': 'scheduled',
-                        'winner_id': None
-                    }
-                ]
-            
-            response = self.client.table('sub_matches').select('*').eq('parent_match_id', parent_match_id).order('match_order').execute()
+                from mock_data import MOCK_SUB_MATCHES
+                return [{**sub_match, 'parent_match_id': parent_match_id} for sub_match in MOCK_SUB_MATCHES]
+            
+            response = _execute_with_retry(self.client.table('sub_matches').select('*').eq('parent_match_id', parent_match_id).order('match_order'))
             return response.data
         except Exception as e:
-            print(f"Error getting sub-matches: {e}")
+            log.exception("Error getting sub-matches")
             return []
     
     def get_sub_matches_with_player_names(self, parent_match_id: str) -> List[Dict]:
@@ -1072,12 +1423,8 @@ class DatabaseManager:
             # For development mode, we need to manually add player names
             if not self.client:
                 # Create a mapping of player IDs to names from our mock data
-                player_names = {
-                    'mock-player-1': 'Alex Rodriguez',
-                    'mock-player-2': 'Maria Santos', 
-                    'mock-player-3': 'David Kim',
-                    'mock-player-4': 'Sarah Johnson'
-                }
+                from mock_data import MOCK_TEAM_PLAYERS
+                player_names = {player['id']: player['name'] for player in MOCK_TEAM_PLAYERS}
                 
                 # Add player names to each sub-match
                 for sub_match in sub_matches:
@@ -1089,50 +1436,31 @@ class DatabaseManager:
                 
                 return sub_matches
             
-            # For production mode, we'd need to join with players table
-            # This would be a more complex query or multiple queries
-            enhanced_sub_matches = []
+            # Fetch every referenced player's name in one query instead of two lookups per sub-match
+            player_ids = {sm.get('team1_player_id') for sm in sub_matches} | {sm.get('team2_player_id') for sm in sub_matches}
+            player_ids.discard(None)
+            players = self.get_players_by_ids(player_ids, columns='id,name')
+            name_map = {player_id: player.get('name') or 'Unknown Player' for player_id, player in players.items()}
+            
             for sub_match in sub_matches:
-                # Get player names
-                team1_player = self.get_player_by_id(sub_match.get('team1_player_id'))
-                team2_player = self.get_player_by_id(sub_match.get('team2_player_id'))
-                
-                sub_match['team1_player_name'] = team1_player.get('name', 'Unknown Player') if team1_player else 'Unknown Player'
-                sub_match['team2_player_name'] = team2_player.get('name', 'Unknown Player') if team2_player else 'Unknown Player'
-                
-                enhanced_sub_matches.append(sub_match)
+                sub_match['team1_player_name'] = name_map.get(sub_match.get('team1_player_id'), 'Unknown Player')
+                sub_match['team2_player_name'] = name_map.get(sub_match.get('team2_player_id'), 'Unknown Player')
             
-            return enhanced_sub_matches
+            return sub_matches
             
         except Exception as e:
-            print(f"Error getting sub-matches with player names: {e}")
+            log.exception("Error getting sub-matches with player names")
             return []
     
     def update_sub_match(self, sub_match_id: str, sub_match_data: Dict) -> Dict:
         """Update sub-match data"""
         try:
-            sub_match_data['updated_at'] = datetime.now().isoformat()
-            
-            # Determine winner based on goals
-            if 'team1_player_goals' in sub_match_data and 'team2_player_goals' in sub_match_data:
-                goals1 = sub_match_data.get('team1_player_goals', 0)
-                goals2 = sub_match_data.get('team2_player_goals', 0)
-                
-                if goals1 > goals2:
-                    sub_match_data['winner_id'] = sub_match_data.get('team1_player_id')
-                elif goals2 > goals1:
-                    sub_match_data['winner_id'] = sub_match_data.get('team2_player_id')
-                else:
-                    sub_match_data['winner_id'] = None  # Draw
-                
-                if goals1 is not None and goals2 is not None:
-                    sub_match_data['status'] = 'completed'
-                    sub_match_data['completed_at'] = datetime.now().isoformat()
-            
             if not self.client:
-                return {'success': True, 'sub_match': sub_match_data}
+                return {'success': True, 'sub_match': _derive_sub_match_result(sub_match_data)}
             
+            # The sub_matches trigger derives winner_id/status/completed_at and stamps updated_at
             response = self.client.table('sub_matches').update(sub_match_data).eq('id', sub_match_id).execute()
+            self._invalidate('sub_matches', sub_match_id)
             return {'success': True, 'sub_match': response.data[0] if response.data else sub_match_data}
         except Exception as e:
             return {'success': False, 'error': str(e)}
@@ -1143,8 +1471,9 @@ class DatabaseManager:
             if not self.client:
                 return {'success': True, 'message': 'Sub-matches deleted (offline mode)'}
             
-            response = self.client.table('sub_matches').delete().eq('parent_match_id', parent_match_id).execute()
-            return {'success': True, 'deleted_count': len(response.data) if response.data else 0}
+            # Count from the Content-Range header instead of echoing every deleted row
+            response = self.client.table('sub_matches').delete(count='exact', returning='minimal').eq('parent_match_id', parent_match_id).execute()
+            return {'success': True, 'deleted_count': response.count or 0}
         except Exception as e:
             return {'success': False, 'error': str(e)}
     
@@ -1154,64 +1483,34 @@ class DatabaseManager:
             if not self.client:
                 return {'success': True, 'message': 'Match participants deleted (offline mode)'}
             
-            response = self.client.table('match_participants').delete().eq('match_id', match_id).execute()
-            return {'success': True, 'deleted_count': len(response.data) if response.data else 0}
+            # Count from the Content-Range header instead of echoing every deleted row
+            response = self.client.table('match_participants').delete(count='exact', returning='minimal').eq('match_id', match_id).execute()
+            return {'success': True, 'deleted_count': response.count or 0}
         except Exception as e:
             return {'success': False, 'error': str(e)}
     
     def calculate_match_summary_from_sub_matches(self, parent_match_id: str) -> Dict:
         """Calculate team scores from sub-matches"""
         try:
-            sub_matches = self.get_sub_matches_by_parent_match(parent_match_id)
-            
-            team1_wins = 0
-            team2_wins = 0
-            draws = 0
-            team1_total_goals = 0
-            team2_total_goals = 0
+            if not self.client:
+                return _summarize_sub_matches(self.get_sub_matches_by_parent_match(parent_match_id))
             
-            for sub_match in sub_matches:
-                if sub_match.get('status') == 'completed':
-                    goals1 = sub_match.get('team1_player_goals', 0)
-                    goals2 = sub_match.get('team2_player_goals', 0)
-                    
-                    team1_total_goals += goals1
-                    team2_total_goals += goals2
-                    
-                    if goals1 > goals2:
-                        team1_wins += 1
-                    elif goals2 > goals1:
-                        team2_wins += 1
-                    else:
-                        draws += 1
-            
-            return {
-                'team1_wins': team1_wins,
-                'team2_wins': team2_wins,
-                'draws': draws,
-                'team1_total_goals': team1_total_goals,
-                'team2_total_goals': team2_total_goals,
-                'completed_sub_matches': team1_wins + team2_wins + draws,
-                'total_sub_matches': len(sub_matches)
-            }
+            # match_summary_v aggregates server-side; a match without sub-matches has no row
+            response = _execute_with_retry(self.client.table('match_summary_v').select(
+                'team1_wins,team2_wins,draws,team1_total_goals,team2_total_goals,completed_sub_matches,total_sub_matches'
+            ).eq('parent_match_id', parent_match_id).maybe_single())
+            return (response.data if response else None) or _summarize_sub_matches([])
         except Exception as e:
-            print(f"Error calculating match summary: {e}")
-            return {
-                'team1_wins': 0,
-                'team2_wins': 0,
-                'draws': 0,
-                'team1_total_goals': 0,
-                'team2_total_goals': 0,
-                'completed_sub_matches': 0,
-                'total_sub_matches': 0
-            }
+            log.exception("Error calculating match summary")
+            return _summarize_sub_matches([])
     
     def create_match_participant(self, participant_data: Dict) -> Dict:
         """Create a match participant record"""
         try:
-            participant_data.setdefault('id', str(uuid4()))
-            participant_data.setdefault('created_at', datetime.now().isoformat())
-            participant_data.setdefault('updated_at', datetime.now().isoformat())
+            participant_data.setdefault('id', uuid.uuid4().hex)
+            now = _now_iso()
+            participant_data.setdefault('created_at', now)
+            participant_data.setdefault('updated_at', now)
             
             if not self.client:
                 return {'success': True, 'participant': participant_data}
@@ -1227,10 +1526,10 @@ class DatabaseManager:
             if not self.client:
                 return []
             
-            response = self.client.table('match_participants').select('*').eq('match_id', match_id).execute()
+            response = _execute_with_retry(self.client.table('match_participants').select('*').eq('match_id', match_id))
             return response.data if response.data else []
         except Exception as e:
-            print(f"Error getting match participants: {e}")
+            log.exception("Error getting match participants")
             return []
     
     def get_match_participants_by_team(self, match_id: str, team_id: str) -> List[Dict]:
@@ -1239,10 +1538,10 @@ class DatabaseManager:
             if not self.client:
                 return []
             
-            response = self.client.table('match_participants').select('*').eq('match_id', match_id).eq('team_id', team_id).execute()
+            response = _execute_with_retry(self.client.table('match_participants').select('*').eq('match_id', match_id).eq('team_id', team_id))
             return response.data if response.data else []
         except Exception as e:
-            print(f"Error getting team participants: {e}")
+            log.exception("Error getting team participants")
             return []
     
     def search_participants_by_email(self, email: str, tournament_name: str = None) -> List[Dict]:
@@ -1250,17 +1549,8 @@ class DatabaseManager:
         try:
             if not self.client:
                 # Return mock data for development
-                mock_participants = [
-                    {
-                        'id': 'mock-participant-1',
-                        'tournament_id': 'mock-tournament-1',
-                        'name': 'John Doe',
-                        'email': email,
-                        'phone': '+1234567890',
-                        'skill_level': 'intermediate',
-                        'created_at': datetime.now().isoformat()
-                    }
-                ] if email else []
+                from mock_data import MOCK_PARTICIPANT_SEARCH_RESULT
+                mock_participants = [{**MOCK_PARTICIPANT_SEARCH_RESULT, 'email': email}] if email else []
                 
                 # Filter by tournament name if provided
                 if tournament_name and mock_participants:
@@ -1270,26 +1560,19 @@ class DatabaseManager:
                 
                 return mock_participants
             
-            # Build query
-            query = self.client.table('participants').select('*').eq('email', email)
-            
-            # Filter by tournament name if provided
+            # Filter by tournament name if provided; !inner makes the embed a join that drops non-matches
             if tournament_name:
-                # Get tournaments matching the name first
-                tournaments_response = self.client.table('tournaments').select('id').ilike('name', f'%{tournament_name}%').execute()
-                tournament_ids = [t['id'] for t in tournaments_response.data] if tournaments_response.data else []
-                
-                if tournament_ids:
-                    query = query.in_('tournament_id', tournament_ids)
-                else:
-                    # No tournaments match the name, return empty
-                    return []
+                query = (self.client.table('participants').select('*,tournaments!inner(id)')
+                         .ilike('tournaments.name', f'%{_ilike_literal(tournament_name)}%'))
+            else:
+                query = self.client.table('participants').select('*')
+            query = query.eq('email', _normalize_email(email))
             
-            response = query.execute()
+            response = _execute_with_retry(query)
             return response.data if response.data else []
             
         except Exception as e:
-            print(f"Error searching participants by email: {e}")
+            log.exception("Error searching participants by email")
             return []
     
     def search_teams_by_email(self, email: str, tournament_name: str = None) -> List[Dict]:
@@ -1297,17 +1580,8 @@ class DatabaseManager:
         try:
             if not self.client:
                 # Return mock data for development
-                mock_teams = [
-                    {
-                        'id': 'mock-team-1',
-                        'tournament_id': 'mock-tournament-2',
-                        'name': 'Dream Team',
-                        'short_name': 'DT',
-                        'contact_email': email,
-                        'contact_phone': '+1234567890',
-                        'created_at': datetime.now().isoformat()
-                    }
-                ] if email else []
+                from mock_data import MOCK_TEAM_SEARCH_RESULT
+                mock_teams = [{**MOCK_TEAM_SEARCH_RESULT, 'captain_email': email}] if email else []
                 
                 # Filter by tournament name if provided
                 if tournament_name and mock_teams:
@@ -1317,39 +1591,21 @@ class DatabaseManager:
                 
                 return mock_teams
             
-            # Build query - search both email and contact_email fields
-            base_query = self.client.table('teams').select('*')
-            
-            # Create OR condition for email fields
-            query1 = base_query.eq('email', email)
-            query2 = base_query.eq('contact_email', email)
-            
-            # Execute both queries and combine results
-            response1 = query1.execute()
-            response2 = query2.execute()
-            
-            teams = []
-            if response1.data:
-                teams.extend(response1.data)
-            if response2.data:
-                # Avoid duplicates by checking IDs
-                existing_ids = {team['id'] for team in teams}
-                teams.extend([team for team in response2.data if team['id'] not in existing_ids])
-            
-            # Filter by tournament name if provided
-            if tournament_name and teams:
-                tournaments_response = self.client.table('tournaments').select('id').ilike('name', f'%{tournament_name}%').execute()
-                tournament_ids = {t['id'] for t in tournaments_response.data} if tournaments_response.data else set()
-                
-                if tournament_ids:
-                    teams = [team for team in teams if team['tournament_id'] in tournament_ids]
-                else:
-                    teams = []
+            # Filter by tournament name if provided; !inner makes the embed a join that drops non-matches
+            if tournament_name:
+                query = (self.client.table('teams').select('*,tournaments!inner(id)')
+                         .ilike('tournaments.name', f'%{_ilike_literal(tournament_name)}%'))
+            else:
+                query = self.client.table('teams').select('*')
+            
+            # captain_email is the team's contact address; stored as typed, so match case-insensitively
+            query = query.ilike('captain_email', _ilike_literal(email.strip()))
             
-            return teams
+            response = _execute_with_retry(query)
+            return response.data if response.data else []
             
         except Exception as e:
-            print(f"Error searching teams by email: {e}")
+            log.exception("Error searching teams by email")
             return []
 
 # Global database manager instance
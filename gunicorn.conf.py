@@ -5,8 +5,10 @@ import os
 bind = f"0.0.0.0:{os.environ.get('PORT', '10000')}"
 
 # Worker processes
-workers = 1  # SocketIO with threading mode works with single worker
-worker_class = "sync"  # Simple sync worker, compatible with threading mode
+# SocketIO sessions live in the worker that created them and gunicorn has no
+# sticky sessions, so one worker per instance; scale out with more instances
+workers = 1
+worker_class = "eventlet"  # Green threads so SocketIO can use real WebSockets
 worker_connections = 1000
 
 # Logging
@@ -5,15 +5,22 @@ Run this script to apply database schema changes.
 """
 
 import os
+import re
 import sys
+from functools import lru_cache
+from pathlib import Path
 from supabase import create_client
 from database import init_supabase, get_supabase_client
 
+@lru_cache(maxsize=32)
+def _read_sql(filename, mtime):
+    """Read a SQL file; keyed on mtime so an edited file is read again"""
+    return Path(filename).read_text(encoding='utf-8')
+
 def read_migration_file(filename):
     """Read SQL migration file"""
     try:
-        with open(filename, 'r', encoding='utf-8') as file:
-            return file.read()
+        return _read_sql(filename, os.path.getmtime(filename))
     except FileNotFoundError:
         print(f"❌ Migration file {filename} not found")
         return None
@@ -21,6 +28,39 @@ def read_migration_file(filename):
         print(f"❌ Error reading {filename}: {e}")
         return None
 
+# Regions a statement-ending semicolon can hide in, plus the semicolon itself
+_SQL_TOKEN = re.compile(r"""
+    '(?:[^']|'')*'                              # string literal
+  | "(?:[^"]|"")*"                              # quoted identifier
+  | --[^\n]*                                    # line comment
+  | /\*.*?\*/                                   # block comment
+  | \$(?P<tag>[A-Za-z_]*)\$.*?\$(?P=tag)\$        # dollar-quoted body
+  | ;
+""", re.S | re.X)
+_LEADING_COMMENTS = re.compile(r'\s*(?:--[^\n]*(?:\n|$)|/\*.*?\*/)\s*', re.S)
+
+def _strip_leading_comments(statement):
+    """Drop comments in front of a statement so it starts with its first keyword"""
+    pos = 0
+    while True:
+        match = _LEADING_COMMENTS.match(statement, pos)
+        if not match or match.end() == pos:
+            return statement[pos:].strip()
+        pos = match.end()
+
+def split_sql_statements(sql_content):
+    """Yield statements one at a time; semicolons in strings, comments and $$ bodies don't split"""
+    start = 0
+    for match in _SQL_TOKEN.finditer(sql_content):
+        if match.group() == ';':
+            yield _strip_leading_comments(sql_content[start:match.start()])
+            start = match.end()
+    yield _strip_leading_comments(sql_content[start:])
+
+def _is_schema_probe(statement):
+    """A SELECT against information_schema, whose rows are shown rather than just run"""
+    return statement[:6].upper() == 'SELECT' and 'information_schema' in statement.lower()
+
 def execute_sql(client, sql_content, migration_name):
     """Execute SQL content using Supabase client"""
     if not client:
@@ -34,13 +74,31 @@ def execute_sql(client, sql_content, migration_name):
     
     try:
         # Split SQL content by statements and execute each one
-        statements = [stmt.strip() for stmt in sql_content.split(';') if stmt.strip()]
+        # Comment-only pieces come back empty; drop them once so numbering counts real statements
+        statements = [statement for statement in split_sql_statements(sql_content) if statement]
+        succeeded = True
+        batch = []  # (number, statement) for consecutive non-query statements
+        
+        def run_batch():
+            """Send the pending statements in one exec_sql call (one round trip, one transaction)"""
+            nonlocal succeeded
+            if not batch:
+                return
+            first, last = batch[0][0], batch[-1][0]
+            label = f"statement {first}" if first == last else f"statements {first}-{last}"
+            print(f"🔄 Executing {label}...")
+            try:
+                client.rpc('exec_sql', {'sql': ';\n'.join(statement for _, statement in batch)}).execute()
+                print(f"✅ {label.capitalize()} executed successfully")
+            except Exception as e:
+                # The whole batch is rolled back together
+                print(f"⚠️ {label.capitalize()} rolled back: {e}")
+                succeeded = False
+            batch.clear()
         
         for i, statement in enumerate(statements):
-            if statement.startswith('--') or not statement:
-                continue
-                
-            if 'SELECT' in statement.upper() and 'FROM information_schema' in statement:
+            if _is_schema_probe(statement):
+                run_batch()
                 # This is the table structure query - execute and show results
                 print(f"📊 Executing query {i+1}...")
                 try:
@@ -52,14 +110,12 @@ def execute_sql(client, sql_content, migration_name):
                 except Exception as e:
                     print(f"⚠️ Query execution note: {e}")
             else:
-                print(f"🔄 Executing statement {i+1}...")
-                try:
-                    client.rpc('exec_sql', {'sql': statement}).execute()
-                    print(f"✅ Statement {i+1} executed successfully")
-                except Exception as e:
-                    print(f"⚠️ Statement {i+1} warning: {e}")
-                    # Continue with other statements
+                batch.append((i + 1, statement))
+        run_batch()
         
+        if not succeeded:
+            print(f"⚠️ Migration {migration_name} finished with rolled-back statements")
+            return False
         print(f"✅ Migration {migration_name} completed successfully")
         return True
         
@@ -0,0 +1,19 @@
+-- Per-match totals over sub-matches, computed in the database
+-- calculate_match_summary_from_sub_matches reads one row from this view instead of every sub-match.
+-- Missing goals count as 0, matching the app's fallback.
+
+CREATE OR REPLACE VIEW match_summary_v AS
+SELECT
+    parent_match_id,
+    COUNT(*) FILTER (WHERE status = 'completed'
+                     AND COALESCE(team1_player_goals, 0) > COALESCE(team2_player_goals, 0))::int AS team1_wins,
+    COUNT(*) FILTER (WHERE status = 'completed'
+                     AND COALESCE(team2_player_goals, 0) > COALESCE(team1_player_goals, 0))::int AS team2_wins,
+    COUNT(*) FILTER (WHERE status = 'completed'
+                     AND COALESCE(team1_player_goals, 0) = COALESCE(team2_player_goals, 0))::int AS draws,
+    COALESCE(SUM(team1_player_goals) FILTER (WHERE status = 'completed'), 0)::int AS team1_total_goals,
+    COALESCE(SUM(team2_player_goals) FILTER (WHERE status = 'completed'), 0)::int AS team2_total_goals,
+    COUNT(*) FILTER (WHERE status = 'completed')::int AS completed_sub_matches,
+    COUNT(*)::int AS total_sub_matches
+FROM sub_matches
+GROUP BY parent_match_id;
@@ -0,0 +1,5 @@
+-- Case-insensitive participant email uniqueness per tournament
+-- The app now stores participant emails lower-cased; this index also covers rows written before that.
+
+CREATE UNIQUE INDEX IF NOT EXISTS participants_tournament_lower_email_key
+    ON participants (tournament_id, lower(email));
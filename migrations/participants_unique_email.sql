@@ -0,0 +1,8 @@
+-- One registration per email per tournament
+-- create_participant upserts on (tournament_id, email) instead of checking first and then inserting.
+-- Blank emails become NULL, which never conflict, so organizers can still add players without an email.
+
+UPDATE participants SET email = NULL WHERE email = '';
+
+ALTER TABLE participants
+    ADD CONSTRAINT participants_tournament_email_key UNIQUE (tournament_id, email);
@@ -0,0 +1,55 @@
+-- Cross-tournament player rankings, aggregated in the database
+-- Rebuilds each completed solo tournament's standings the way calculate_participant_standings does
+-- (3 points a win, 1 a draw; ordered by points, goal difference, goals for), then sums them per player name.
+-- get_player_rankings reads one row per player instead of fetching every tournament's matches.
+
+CREATE OR REPLACE VIEW player_rankings_v AS
+WITH results AS (
+    SELECT m.tournament_id, m.participant1_id AS participant_id,
+           COALESCE(m.participant1_score, 0) AS goals_for, COALESCE(m.participant2_score, 0) AS goals_against,
+           m.participant2_id AS opponent_id
+    FROM solo_matches m
+    WHERE m.status = 'completed'
+    UNION ALL
+    SELECT m.tournament_id, m.participant2_id,
+           COALESCE(m.participant2_score, 0), COALESCE(m.participant1_score, 0),
+           m.participant1_id
+    FROM solo_matches m
+    WHERE m.status = 'completed'
+),
+standings AS (
+    SELECT p.tournament_id, p.id, p.name, p.created_at,
+           COUNT(o.id) FILTER (WHERE r.goals_for > r.goals_against) AS wins,
+           COUNT(o.id) FILTER (WHERE r.goals_for = r.goals_against) AS draws,
+           COUNT(o.id) FILTER (WHERE r.goals_for < r.goals_against) AS losses,
+           COALESCE(SUM(r.goals_for) FILTER (WHERE o.id IS NOT NULL), 0) AS goals_for,
+           COALESCE(SUM(r.goals_against) FILTER (WHERE o.id IS NOT NULL), 0) AS goals_against
+    FROM participants p
+    JOIN tournaments t ON t.id = p.tournament_id AND t.status = 'completed' AND t.type = 'solo'
+    LEFT JOIN results r ON r.participant_id = p.id AND r.tournament_id = p.tournament_id
+    -- Matches against someone no longer in the tournament don't count, as in the app
+    LEFT JOIN participants o ON o.id = r.opponent_id AND o.tournament_id = p.tournament_id
+    GROUP BY p.tournament_id, p.id, p.name, p.created_at
+),
+ranked AS (
+    SELECT s.*,
+           3 * s.wins + s.draws AS points,
+           ROW_NUMBER() OVER (
+               PARTITION BY s.tournament_id
+               ORDER BY 3 * s.wins + s.draws DESC, s.goals_for - s.goals_against DESC, s.goals_for DESC,
+                        s.created_at, s.id
+           ) AS position
+    FROM standings s
+)
+SELECT COALESCE(name, 'Unknown') AS name,
+       COUNT(*)::int AS tournaments_played,
+       COUNT(*) FILTER (WHERE position = 1)::int AS tournaments_won,
+       SUM(points)::int AS total_points,
+       SUM(wins)::int AS total_wins,
+       SUM(draws)::int AS total_draws,
+       SUM(losses)::int AS total_losses,
+       SUM(goals_for)::int AS total_goals_for,
+       SUM(goals_against)::int AS total_goals_against,
+       MIN(position)::int AS best_finish
+FROM ranked
+GROUP BY COALESCE(name, 'Unknown');
@@ -0,0 +1,30 @@
+-- Save a team match's sub-matches in one round trip
+-- Deletes the match's existing sub-matches and match participants and inserts the new
+-- sub-matches in a single transaction; returns the number of sub-matches inserted.
+-- Only the columns the app sends are inserted, so every other column keeps its DEFAULT.
+-- Run this in the Supabase SQL Editor (the function body contains semicolons).
+
+CREATE OR REPLACE FUNCTION replace_sub_matches(
+    p_parent_match_id sub_matches.parent_match_id%TYPE,
+    p_sub_matches jsonb
+) RETURNS integer AS $$
+DECLARE
+    inserted integer;
+BEGIN
+    DELETE FROM match_participants WHERE match_id = p_parent_match_id;
+    DELETE FROM sub_matches WHERE parent_match_id = p_parent_match_id;
+
+    INSERT INTO sub_matches (
+        id, parent_match_id, tournament_id, team1_id, team2_id,
+        team1_player_id, team2_player_id, team1_player_goals, team2_player_goals,
+        winner_id, match_order, status, created_at
+    )
+    SELECT id, parent_match_id, tournament_id, team1_id, team2_id,
+           team1_player_id, team2_player_id, team1_player_goals, team2_player_goals,
+           winner_id, match_order, status, created_at
+    FROM jsonb_populate_recordset(NULL::sub_matches, p_sub_matches);
+    GET DIAGNOSTICS inserted = ROW_COUNT;
+
+    RETURN inserted;
+END;
+$$ LANGUAGE plpgsql;
@@ -0,0 +1,52 @@
+-- Server-side defaults for ids and timestamps
+-- The app no longer sends id/created_at/updated_at on insert or update for these tables;
+-- Postgres fills them in and the inserted row comes back in the response.
+-- Run this in the Supabase SQL Editor (the function body contains semicolons).
+
+CREATE EXTENSION IF NOT EXISTS pgcrypto;
+
+-- ids and created/updated timestamps
+ALTER TABLE tournaments ALTER COLUMN id SET DEFAULT gen_random_uuid();
+ALTER TABLE tournaments ALTER COLUMN created_at SET DEFAULT now();
+ALTER TABLE tournaments ALTER COLUMN updated_at SET DEFAULT now();
+
+ALTER TABLE teams ALTER COLUMN id SET DEFAULT gen_random_uuid();
+ALTER TABLE teams ALTER COLUMN created_at SET DEFAULT now();
+
+ALTER TABLE players ALTER COLUMN id SET DEFAULT gen_random_uuid();
+ALTER TABLE players ALTER COLUMN created_at SET DEFAULT now();
+
+ALTER TABLE participants ALTER COLUMN id SET DEFAULT gen_random_uuid();
+ALTER TABLE participants ALTER COLUMN created_at SET DEFAULT now();
+
+ALTER TABLE matches ALTER COLUMN id SET DEFAULT gen_random_uuid();
+ALTER TABLE matches ALTER COLUMN created_at SET DEFAULT now();
+
+ALTER TABLE solo_matches ALTER COLUMN id SET DEFAULT gen_random_uuid();
+ALTER TABLE solo_matches ALTER COLUMN created_at SET DEFAULT now();
+
+-- updated_at maintained by trigger
+CREATE OR REPLACE FUNCTION set_updated_at() RETURNS trigger AS $$
+BEGIN
+    NEW.updated_at = now();
+    RETURN NEW;
+END;
+$$ LANGUAGE plpgsql;
+
+DROP TRIGGER IF EXISTS set_updated_at ON tournaments;
+CREATE TRIGGER set_updated_at BEFORE UPDATE ON tournaments FOR EACH ROW EXECUTE FUNCTION set_updated_at();
+
+DROP TRIGGER IF EXISTS set_updated_at ON teams;
+CREATE TRIGGER set_updated_at BEFORE UPDATE ON teams FOR EACH ROW EXECUTE FUNCTION set_updated_at();
+
+DROP TRIGGER IF EXISTS set_updated_at ON players;
+CREATE TRIGGER set_updated_at BEFORE UPDATE ON players FOR EACH ROW EXECUTE FUNCTION set_updated_at();
+
+DROP TRIGGER IF EXISTS set_updated_at ON participants;
+CREATE TRIGGER set_updated_at BEFORE UPDATE ON participants FOR EACH ROW EXECUTE FUNCTION set_updated_at();
+
+DROP TRIGGER IF EXISTS set_updated_at ON matches;
+CREATE TRIGGER set_updated_at BEFORE UPDATE ON matches FOR EACH ROW EXECUTE FUNCTION set_updated_at();
+
+DROP TRIGGER IF EXISTS set_updated_at ON solo_matches;
+CREATE TRIGGER set_updated_at BEFORE UPDATE ON solo_matches FOR EACH ROW EXECUTE FUNCTION set_updated_at();
@@ -0,0 +1,30 @@
+-- Derive a sub-match's result in the database on update
+-- update_sub_match now sends only the changed columns (typically the two goal counts);
+-- this trigger sets winner_id, status and completed_at from the row's goals and players,
+-- and stamps updated_at.
+-- Run this in the Supabase SQL Editor (the function body contains semicolons).
+
+CREATE OR REPLACE FUNCTION compute_sub_match_winner() RETURNS trigger AS $$
+BEGIN
+    NEW.updated_at = now();
+
+    -- Only a fully entered score decides the sub-match
+    IF NEW.team1_player_goals IS NOT NULL AND NEW.team2_player_goals IS NOT NULL
+       AND (NEW.team1_player_goals IS DISTINCT FROM OLD.team1_player_goals
+            OR NEW.team2_player_goals IS DISTINCT FROM OLD.team2_player_goals
+            OR OLD.status IS DISTINCT FROM 'completed') THEN
+        NEW.winner_id = CASE
+            WHEN NEW.team1_player_goals > NEW.team2_player_goals THEN NEW.team1_player_id
+            WHEN NEW.team2_player_goals > NEW.team1_player_goals THEN NEW.team2_player_id
+        END;
+        NEW.status = 'completed';
+        NEW.completed_at = now();
+    END IF;
+
+    RETURN NEW;
+END;
+$$ LANGUAGE plpgsql;
+
+DROP TRIGGER IF EXISTS trg_sub_match_winner ON sub_matches;
+CREATE TRIGGER trg_sub_match_winner BEFORE UPDATE ON sub_matches
+    FOR EACH ROW EXECUTE FUNCTION compute_sub_match_winner();
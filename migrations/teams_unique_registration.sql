@@ -0,0 +1,14 @@
+-- One team per name, captain email and tag per tournament (case-insensitive)
+-- register_for_tournament checks these with indexed ilike lookups instead of fetching every team;
+-- the indexes also reject a concurrent registration that slips past those checks.
+
+CREATE UNIQUE INDEX IF NOT EXISTS teams_tournament_name_key
+    ON teams (tournament_id, lower(name));
+
+CREATE UNIQUE INDEX IF NOT EXISTS teams_tournament_captain_email_key
+    ON teams (tournament_id, lower(captain_email))
+    WHERE captain_email IS NOT NULL AND captain_email <> '';
+
+CREATE UNIQUE INDEX IF NOT EXISTS teams_tournament_short_name_key
+    ON teams (tournament_id, upper(short_name))
+    WHERE short_name IS NOT NULL AND short_name <> '';
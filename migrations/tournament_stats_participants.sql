@@ -0,0 +1,23 @@
+-- Add a participants column to tournament_stats_v
+-- Solo tournaments count their participants rows; team tournaments count the players on their teams.
+-- The home page reads every platform total from these few rows instead of counting per tournament.
+-- Run after tournament_stats_view.sql (CREATE OR REPLACE VIEW may only append columns).
+
+CREATE OR REPLACE VIEW tournament_stats_v AS
+SELECT t.type,
+       t.status,
+       COUNT(*)::int AS count,
+       COALESCE(SUM(CASE WHEN t.type = 'solo' THEN pc.n ELSE tp.n END), 0)::int AS participants
+FROM tournaments t
+LEFT JOIN (
+    SELECT tournament_id, COUNT(*) AS n
+    FROM participants
+    GROUP BY tournament_id
+) pc ON pc.tournament_id = t.id
+LEFT JOIN (
+    SELECT tm.tournament_id, COUNT(*) AS n
+    FROM players pl
+    JOIN teams tm ON tm.id = pl.team_id
+    GROUP BY tm.tournament_id
+) tp ON tp.tournament_id = t.id
+GROUP BY t.type, t.status;
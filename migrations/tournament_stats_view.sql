@@ -0,0 +1,7 @@
+-- Platform-wide tournament counts per type and status
+-- get_tournament_stats reads these few rows instead of downloading every tournament to count them.
+
+CREATE OR REPLACE VIEW tournament_stats_v AS
+SELECT type, status, COUNT(*)::int AS count
+FROM tournaments
+GROUP BY type, status;
@@ -0,0 +1,273 @@
+"""
+Mock rows returned by DatabaseManager when no Supabase client is configured.
+Imported lazily from the mock branches. The constants are shared, so getters hand out copies
+(with the requested IDs filled in) rather than the constants themselves.
+"""
+
+MOCK_TIMESTAMP = '2024-12-09T10:00:00+00:00'
+
+MOCK_USER = {
+    'email': 'test@example.com',
+    'full_name': 'Test User',
+    'created_at': MOCK_TIMESTAMP
+}
+
+MOCK_TOURNAMENT = {
+    'name': 'eFootball Solo Championship',
+    'description': 'A mock solo tournament for development and testing',
+    'sport': 'efootball',
+    'format': 'single_elimination',
+    'type': 'solo',
+    'status': 'registration_open',
+    'max_participants': 32,
+    'max_teams': None,
+    'max_players_per_team': None,
+    'scoring_system': None,  # Solo tournaments don't have scoring systems
+    'entry_fee': 0,
+    'prize_pool': 500,
+    'organizer_id': 'mock-organizer-123',
+    'is_public': True,
+    'location': 'Online',
+    'rules': 'Standard eFootball rules apply',
+    'created_at': MOCK_TIMESTAMP,
+    'updated_at': MOCK_TIMESTAMP
+}
+
+MOCK_TEAM = {
+    'name': 'Mock Team',
+    'short_name': 'MOCK',
+    'captain_name': 'Mock Captain',
+    'captain_email': 'mock@example.com',
+    'captain_phone': '123-456-7890',
+    'is_approved': True,
+    'created_at': MOCK_TIMESTAMP
+}
+
+MOCK_TEAM_PLAYERS = [
+    {
+        'id': 'mock-player-1',
+        'name': 'Alex Rodriguez',
+        'jersey_number': 10,
+        'position': 'Forward',
+        'email': 'alex@example.com'
+    },
+    {
+        'id': 'mock-player-2',
+        'name': 'Maria Santos',
+        'jersey_number': 7,
+        'position': 'Midfielder',
+        'email': 'maria@example.com'
+    },
+    {
+        'id': 'mock-player-3',
+        'name': 'David Kim',
+        'jersey_number': 9,
+        'position': 'Forward',
+        'email': 'david@example.com'
+    },
+    {
+        'id': 'mock-player-4',
+        'name': 'Sarah Johnson',
+        'jersey_number': 11,
+        'position': 'Midfielder',
+        'email': 'sarah@example.com'
+    }
+]
+
+MOCK_PLAYER = {
+    'name': 'Mock Player',
+    'jersey_number': 1,
+    'position': 'Forward',
+    'email': 'mock@example.com',
+    'phone': '123-456-7890',
+    'created_at': MOCK_TIMESTAMP
+}
+
+MOCK_PARTICIPANTS = [
+    {
+        'id': 'mock-participant-1',
+        'name': 'John Doe',
+        'email': 'john@example.com',
+        'gamer_tag': 'JohnGamer',
+        'status': 'active',
+        'created_at': '2024-12-09T10:00:00Z'
+    },
+    {
+        'id': 'mock-participant-2',
+        'name': 'Jane Smith', 
+        'email': 'jane@example.com',
+        'gamer_tag': 'JanePlayer',
+        'status': 'active',
+        'created_at': '2024-12-09T11:00:00Z'
+    },
+    {
+        'id': 'mock-participant-3',
+        'name': 'Mike Wilson',
+        'email': 'mike@example.com', 
+        'gamer_tag': 'MikeChamp',
+        'status': 'active',
+        'created_at': '2024-12-09T12:00:00Z'
+    }
+]
+
+MOCK_PARTICIPANT = {
+    'name': 'Mock Participant',
+    'email': 'mock@example.com',
+    'phone': '123-456-7890',
+    'gamer_tag': 'MockGamer',
+    'skill_level': 'Intermediate',
+    'status': 'active',
+    'created_at': MOCK_TIMESTAMP
+}
+
+MOCK_SOLO_MATCHES = [
+    {
+        'id': 'mock-solo-match-1',
+        'participant1_id': 'mock-participant-1',
+        'participant2_id': 'mock-participant-2',
+        'participant1_score': 2,
+        'participant2_score': 1,
+        'status': 'completed',
+        'winner_id': 'mock-participant-1',
+        'round': 1,
+        'created_at': '2024-12-09T14:00:00Z'
+    },
+    {
+        'id': 'mock-solo-match-2',
+        'participant1_id': 'mock-participant-3',
+        'participant2_id': 'mock-participant-1',
+        'participant1_score': None,
+        'participant2_score': None,
+        'status': 'scheduled',
+        'winner_id': None,
+        'round': 1,
+        'created_at': '2024-12-09T15:00:00Z'
+    }
+]
+
+MOCK_MATCH = {
+    'team1_id': 'mock-team-1',
+    'team2_id': 'mock-team-2',
+    'status': 'scheduled',
+    'team1_score': 0,
+    'team2_score': 0,
+    'team1_player_goals': None,
+    'team2_player_goals': None,
+    'team1_player_id': None,
+    'team2_player_id': None,
+    'venue': '',
+    'notes': '',
+    'referee': '',
+    'created_at': MOCK_TIMESTAMP
+}
+
+MOCK_SOLO_MATCH = {
+    'tournament_id': 'mock-tournament-123',
+    'participant1_id': 'mock-participant-1',
+    'participant2_id': 'mock-participant-2',
+    'participant1_score': None,
+    'participant2_score': None,
+    'status': 'scheduled',
+    'winner_id': None,
+    'round': 1,
+    'match_date': None,
+    'created_at': MOCK_TIMESTAMP
+}
+
+# Platform-wide list for the home page statistics; built once at import
+MOCK_ALL_TOURNAMENTS = tuple(
+    {
+        'id': f'mock-tournament-{i}',
+        'name': f'Tournament {i}',
+        'type': 'solo' if i % 2 == 0 else 'team',
+        'status': 'completed' if i < 800 else ('in_progress' if i < 850 else 'registration_open'),
+        'created_at': MOCK_TIMESTAMP,
+        'organizer_id': f'user-{i % 100}'
+    } for i in range(1, 1001)
+)
+
+MOCK_PUBLIC_TOURNAMENTS = (
+    {
+        'id': 'mock-tournament-1',
+        'name': 'eFootball Championship 2024',
+        'description': 'Annual eFootball tournament for all skill levels',
+        'type': 'solo',
+        'format': 'single_elimination',
+        'status': 'registration_open',
+        'max_participants': 32,
+        'registration_deadline': '2024-12-31T23:59:59',
+        'start_date': '2025-01-15T18:00:00',
+        'entry_fee': 0,
+        'prize_pool': 1000,
+        'organizer_name': 'Tournament Admin',
+        'created_at': MOCK_TIMESTAMP,
+        'participant_count': 12
+    },
+    {
+        'id': 'mock-tournament-2',
+        'name': 'Team eFootball League',
+        'description': 'Professional team competition',
+        'type': 'team',
+        'format': 'round_robin',
+        'status': 'registration_open',
+        'max_teams': 16,
+        'registration_deadline': '2024-12-25T23:59:59',
+        'start_date': '2025-01-10T19:00:00',
+        'entry_fee': 50,
+        'prize_pool': 5000,
+        'organizer_name': 'Pro League',
+        'created_at': MOCK_TIMESTAMP,
+        'team_count': 8
+    }
+)
+
+MOCK_SUB_MATCHES = (
+    {
+        'id': 'mock-sub-match-1',
+        'team1_player_id': 'mock-player-1',
+        'team2_player_id': 'mock-player-2',
+        'team1_player_goals': 2,
+        'team2_player_goals': 1,
+        'match_order': 1,
+        'status': 'completed',
+        'winner_id': 'mock-player-1'
+    },
+    {
+        'id': 'mock-sub-match-2',
+        'team1_player_id': 'mock-player-3',
+        'team2_player_id': 'mock-player-4',
+        'team1_player_goals': 1,
+        'team2_player_goals': 3,
+        'match_order': 2,
+        'status': 'completed',
+        'winner_id': 'mock-player-4'
+    },
+    {
+        'id': 'mock-sub-match-3',
+        'team1_player_id': 'mock-player-1',
+        'team2_player_id': 'mock-player-4',
+        'team1_player_goals': None,
+        'team2_player_goals': None,
+        'match_order': 3,
+        'status': 'scheduled',
+        'winner_id': None
+    }
+)
+
+MOCK_PARTICIPANT_SEARCH_RESULT = {
+    'id': 'mock-participant-1',
+    'tournament_id': 'mock-tournament-1',
+    'name': 'John Doe',
+    'phone': '+1234567890',
+    'skill_level': 'intermediate',
+    'created_at': MOCK_TIMESTAMP
+}
+
+MOCK_TEAM_SEARCH_RESULT = {
+    'id': 'mock-team-1',
+    'tournament_id': 'mock-tournament-2',
+    'name': 'Dream Team',
+    'short_name': 'DT',
+    'captain_phone': '+1234567890',
+    'created_at': MOCK_TIMESTAMP
+}
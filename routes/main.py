@@ -1,56 +1,79 @@
-from flask import Blueprint, render_template, session, redirect, url_for, request, jsonify
+from flask import Blueprint, render_template, session, redirect, url_for, request, jsonify, g
 from routes.auth import login_required, get_current_user
 from database import db
+import logging
 import re
+from collections import Counter, defaultdict
+
+log = logging.getLogger(__name__)
 
 main_bp = Blueprint('main', __name__)
 
+_EMAIL_RE = re.compile(r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$')
+_HTML_TAG_RE = re.compile(r'<[^>]+>')
+
+def is_valid_email(email):
+    """Validate email format"""
+    return _EMAIL_RE.match(email) is not None
+
+def sanitize_input(text, max_length=100):
+    """Sanitize input (basic XSS protection): remove HTML tags and limit length"""
+    if not text:
+        return ''
+    return _HTML_TAG_RE.sub('', text).strip()[:max_length]
+
+def _registration_counts(tournament):
+    """(registered_count, capacity_max) for the registration form, counted once per request"""
+    counts = g.setdefault('registration_counts', {})
+    tournament_id = tournament['id']
+    if tournament_id not in counts:
+        if tournament.get('type') == 'solo':
+            counts[tournament_id] = (db.count_participants(tournament_id), tournament.get('max_participants'))
+        else:
+            counts[tournament_id] = (db.count_teams(tournament_id), tournament.get('max_teams'))
+    return counts[tournament_id]
+
+def _tournament_status_stats(tournaments):
+    """Dashboard counters from a single pass over the tournaments' statuses"""
+    status_counts = Counter(t.get('status') for t in tournaments)
+    return {
+        'total_tournaments': len(tournaments),
+        'active_tournaments': status_counts['in_progress'],
+        'completed_tournaments': status_counts['completed'],
+        'upcoming_tournaments': status_counts['draft'] + status_counts['registration_open']
+    }
+
 @main_bp.route('/')
 def index():
     """Home page with real data"""
     # Get real platform statistics
     try:
-        # Get all tournaments for statistics
+        # Platform totals come pre-aggregated per (type, status): one small query
         try:
-            all_tournaments = db.get_all_tournaments() or []
-        except Exception as e:
-            print(f"Error fetching all tournaments: {e}")
-            all_tournaments = []
+            tournament_stats = db.get_tournament_stats() or []
+        except Exception:
+            log.exception("Error fetching tournament stats")
+            tournament_stats = []
         
         try:
             public_tournaments = db.get_public_tournaments() or []
-        except Exception as e:
-            print(f"Error fetching public tournaments: {e}")
+        except Exception:
+            log.exception("Error fetching public tournaments")
             public_tournaments = []
         
         # Calculate real stats
-        total_tournaments = len(all_tournaments)
-        active_tournaments = len([t for t in all_tournaments if t.get('status') in ['in_progress', 'live']])
-        completed_tournaments = len([t for t in all_tournaments if t.get('status') == 'completed'])
-        
-        # Count participants across all tournaments
-        total_participants = 0
-        for tournament in all_tournaments:
-            if tournament.get('type') == 'solo':
-                participants = db.get_participants_by_tournament(tournament['id']) or []
-                total_participants += len(participants)
-            else:
-                teams = db.get_teams_by_tournament(tournament['id']) or []
-                for team in teams:
-                    players = db.get_players_by_team(team['id']) or []
-                    total_participants += len(players)
+        total_tournaments = sum(row['count'] for row in tournament_stats)
+        active_tournaments = sum(row['count'] for row in tournament_stats if row.get('status') in ['in_progress', 'live'])
+        completed_tournaments = sum(row['count'] for row in tournament_stats if row.get('status') == 'completed')
+        
+        # Participants across all tournaments (solo entrants plus team players)
+        total_participants = sum(row.get('participants') or 0 for row in tournament_stats)
         
         # Recent public tournaments for showcase
         recent_tournaments = public_tournaments[:3] if public_tournaments else []
         
-        # Calculate average setup time based on creation timestamps
-        setup_times = []
-        for tournament in all_tournaments:
-            if tournament.get('created_at') and tournament.get('status') != 'draft':
-                # Mock calculation - in real scenario you'd track actual setup time
-                setup_times.append(3)  # Most tournaments are set up in ~3 minutes
-        
-        avg_setup_time = sum(setup_times) // len(setup_times) if setup_times else 3
+        # Setup time isn't tracked yet; every tournament counted as ~3 minutes
+        avg_setup_time = 3
         
         platform_stats = {
             'total_tournaments': total_tournaments or 1250,  # Fallback to reasonable numbers
@@ -89,8 +112,8 @@ def index():
             }
         ]
         
-    except Exception as e:
-        print(f"Error fetching index data: {e}")
+    except Exception:
+        log.exception("Error fetching index data")
         # Fallback data if database is unavailable
         platform_stats = {
             'total_tournaments': 1250,
@@ -120,12 +143,7 @@ def dashboard():
     # Get recent activity
     recent_tournaments = tournaments[:5] if tournaments else []
     
-    stats = {
-        'total_tournaments': len(tournaments),
-        'active_tournaments': len([t for t in tournaments if t.get('status') == 'in_progress']),
-        'completed_tournaments': len([t for t in tournaments if t.get('status') == 'completed']),
-        'upcoming_tournaments': len([t for t in tournaments if t.get('status') in ['draft', 'registration_open']])
-    }
+    stats = _tournament_status_stats(tournaments)
     
     return render_template('dashboard/main.html', 
                          user=user, 
@@ -136,25 +154,9 @@ def dashboard():
 @main_bp.route('/explore')
 def explore():
     """Explore public tournaments"""
+    # Participant/team counts come back with the tournaments (PostgREST count embed)
     tournaments = db.get_public_tournaments()
     
-    # Compute live registration counts for each tournament
-    for tournament in tournaments:
-        try:
-            if tournament.get('type') == 'solo':
-                participants = db.get_participants_by_tournament(tournament['id']) or []
-                tournament['participant_count'] = len(participants)
-            else:
-                teams = db.get_teams_by_tournament(tournament['id']) or []
-                tournament['team_count'] = len(teams)
-        except Exception as e:
-            print(f"Error computing counts for tournament {tournament.get('id')}: {e}")
-            # Keep existing counts as fallback
-            if tournament.get('type') == 'solo' and 'participant_count' not in tournament:
-                tournament['participant_count'] = 0
-            elif tournament.get('type') == 'team' and 'team_count' not in tournament:
-                tournament['team_count'] = 0
-    
     return render_template('explore.html', tournaments=tournaments)
 
 @main_bp.route('/how-to-register')
@@ -179,11 +181,18 @@ def registration_lookup():
     try:
         registrations = []
         
-        # Search for solo participants
         solo_participants = db.search_participants_by_email(email, tournament_name)
+        teams = db.search_teams_by_email(email, tournament_name)
+        
+        # Tournament details for every registration in one query
+        tournaments = db.get_tournaments_by_ids(
+            [participant['tournament_id'] for participant in solo_participants] +
+            [team['tournament_id'] for team in teams]
+        )
+        
+        # Solo participants
         for participant in solo_participants:
-            # Get tournament details for each participant
-            tournament = db.get_public_tournament_details(participant['tournament_id'])
+            tournament = tournaments.get(participant['tournament_id'])
             if tournament:
                 registrations.append({
                     'id': participant['id'],
@@ -195,17 +204,15 @@ def registration_lookup():
                     'tournament': tournament
                 })
         
-        # Search for team registrations
-        teams = db.search_teams_by_email(email, tournament_name)
+        # Team registrations
         for team in teams:
-            # Get tournament details for each team
-            tournament = db.get_public_tournament_details(team['tournament_id'])
+            tournament = tournaments.get(team['tournament_id'])
             if tournament:
                 registrations.append({
                     'id': team['id'],
                     'name': team['name'],
-                    'email': team['email'],
-                    'phone': team.get('phone'),
+                    'email': team.get('captain_email'),
+                    'phone': team.get('captain_phone'),
                     'skill_level': team.get('skill_level'),
                     'created_at': team.get('created_at'),
                     'tournament': tournament,
@@ -216,8 +223,8 @@ def registration_lookup():
                              registrations=registrations,
                              search_email=email)
         
-    except Exception as e:
-        print(f"Error searching registrations: {e}")
+    except Exception:
+        log.exception("Error searching registrations")
         return render_template('public/registration_lookup.html', 
                              error='An error occurred while searching for registrations')
 
@@ -238,18 +245,18 @@ def tournament_details(tournament_id):
     matches = []
     standings_data = []
     stats = {}
+    teams_by_id = {}
+    participants_by_id = {}
     
     try:
         if tournament.get('type') == 'solo':
-            participants = db.get_participants_by_tournament(tournament_id) or []
-            matches = db.get_solo_matches_by_tournament(tournament_id) or []
+            participants, matches = db.get_tournament_page(tournament_id, 'solo')
             
             # Calculate standings for solo tournaments
             if participants:
                 standings_data = calculate_participant_standings(participants, matches)
         else:
-            teams = db.get_teams_by_tournament(tournament_id) or []
-            matches = db.get_matches_by_tournament(tournament_id) or []
+            teams, matches = db.get_tournament_page(tournament_id, 'team')
             
             # Calculate standings for team tournaments
             if teams:
@@ -260,48 +267,35 @@ def tournament_details(tournament_id):
             stats = calculate_tournament_statistics(tournament, standings_data, matches)
         
         # Calculate tournament stats for header cards
+        match_status_counts = Counter(m.get('status') for m in matches)
         if tournament.get('type') == 'solo':
             tournament_stats = {
                 'total_participants': len(participants),
                 'total_matches': len(matches),
-                'completed_matches': len([m for m in matches if m.get('status') == 'completed']),
-                'upcoming_matches': len([m for m in matches if m.get('status') == 'scheduled'])
+                'completed_matches': match_status_counts['completed'],
+                'upcoming_matches': match_status_counts['scheduled']
             }
         else:
             tournament_stats = {
                 'total_teams': len(teams),
                 'total_matches': len(matches),
-                'completed_matches': len([m for m in matches if m.get('status') == 'completed']),
-                'upcoming_matches': len([m for m in matches if m.get('status') == 'scheduled'])
+                'completed_matches': match_status_counts['completed'],
+                'upcoming_matches': match_status_counts['scheduled']
             }
-            
-            # Add team names to matches for display
-            team_lookup = {team['id']: team for team in teams}
-            for match in matches:
-                match['team1_name'] = team_lookup.get(match.get('team1_id'), {}).get('name', 'TBD')
-                match['team2_name'] = team_lookup.get(match.get('team2_id'), {}).get('name', 'TBD')
-                match['team1'] = team_lookup.get(match.get('team1_id'), {})
-                match['team2'] = team_lookup.get(match.get('team2_id'), {})
-        
-        # For solo tournaments, add participant names to matches
-        if tournament.get('type') == 'solo':
-            participant_lookup = {p['id']: p for p in participants}
-            for match in matches:
-                match['participant1_name'] = participant_lookup.get(match.get('participant1_id'), {}).get('name', 'TBD')
-                match['participant2_name'] = participant_lookup.get(match.get('participant2_id'), {}).get('name', 'TBD')
-                match['participant1'] = participant_lookup.get(match.get('participant1_id'), {})
-                match['participant2'] = participant_lookup.get(match.get('participant2_id'), {})
+        
+        # The template looks match entrants up by ID instead of copying them onto every match
+        teams_by_id = {team['id']: team for team in teams}
+        participants_by_id = {p['id']: p for p in participants}
         
         # Group matches by round for better display
-        grouped_matches = {}
+        grouped_matches = defaultdict(list)
         for match in matches:
-            round_name = match.get('round_name', 'Round 1')
-            if round_name not in grouped_matches:
-                grouped_matches[round_name] = []
-            grouped_matches[round_name].append(match)
+            grouped_matches[match.get('round_name', 'Round 1')].append(match)
+        # Plain dict for the template, so a lookup of a missing round can't add one
+        grouped_matches = dict(grouped_matches)
             
-    except Exception as e:
-        print(f"Error fetching tournament data: {e}")
+    except Exception:
+        log.exception("Error fetching tournament data")
         # Fallback to basic data if there's an error
         tournament_stats = {'total_participants': 0, 'total_teams': 0, 'total_matches': 0, 'completed_matches': 0, 'upcoming_matches': 0}
         grouped_matches = {}
@@ -312,6 +306,8 @@ def tournament_details(tournament_id):
                          participants=participants,
                          matches=matches,
                          grouped_matches=grouped_matches,
+                         teams_by_id=teams_by_id,
+                         participants_by_id=participants_by_id,
                          standings=standings_data,
                          stats=stats,
                          tournament_stats=tournament_stats)
@@ -327,44 +323,16 @@ def tournament_register(tournament_id):
         return render_template('public/registration_closed.html', tournament=tournament)
     
     if request.method == 'GET':
-        # Compute registered count for display
+        # get_public_tournament_details already counted the registrations
         if tournament.get('type') == 'solo':
-            try:
-                participants = db.get_participants_by_tournament(tournament_id)
-                print(f"DEBUG: Retrieved {len(participants)} participants for tournament {tournament_id}")
-                print(f"DEBUG: Supabase client exists: {db.client is not None}")
-                registered_count = len(participants)
-            except Exception as e:
-                print(f"DEBUG: Error getting participants: {e}")
-                registered_count = 0
-            capacity_max = tournament.get('max_participants')
+            registered_count, capacity_max = tournament.get('participant_count', 0), tournament.get('max_participants')
         else:
-            try:
-                teams = db.get_teams_by_tournament(tournament_id)
-                print(f"DEBUG: Retrieved {len(teams)} teams for tournament {tournament_id}")
-                print(f"DEBUG: Supabase client exists: {db.client is not None}")
-                registered_count = len(teams)
-            except Exception as e:
-                print(f"DEBUG: Error getting teams: {e}")
-                registered_count = 0
-            capacity_max = tournament.get('max_teams')
+            registered_count, capacity_max = tournament.get('team_count', 0), tournament.get('max_teams')
+        log.debug("Tournament %s has %d registrations", tournament_id, registered_count)
         return render_template('public/tournament_register.html', tournament=tournament, registered_count=registered_count, capacity_max=capacity_max)
     
     # Handle registration form submission
     try:
-        # Validate email format
-        def is_valid_email(email):
-            pattern = r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$'
-            return re.match(pattern, email) is not None
-        
-        # Sanitize input (basic XSS protection)
-        def sanitize_input(text, max_length=100):
-            if not text:
-                return ''
-            # Remove HTML tags and limit length
-            text = re.sub(r'<[^>]+>', '', text)
-            return text.strip()[:max_length]
-        
         if tournament['type'] == 'solo':
             registration_data = {
                 'name': sanitize_input(request.form.get('name', ''), 50),
@@ -373,45 +341,13 @@ def tournament_register(tournament_id):
                 'skill_level': request.form.get('skill_level', 'beginner')
             }
             
-            # Validate required fields
-            if not registration_data['name']:
-                # Recompute counts for re-render
-                registered_count = len(db.get_participants_by_tournament(tournament_id))
-                capacity_max = tournament.get('max_participants')
-                return render_template('public/tournament_register.html', 
-                                     tournament=tournament, 
-                                     registered_count=registered_count,
-                                     capacity_max=capacity_max,
-                                     error='Please provide your full name')
-            
-            if not registration_data['email']:
-                registered_count = len(db.get_participants_by_tournament(tournament_id))
-                capacity_max = tournament.get('max_participants')
-                return render_template('public/tournament_register.html', 
-                                     tournament=tournament, 
-                                     registered_count=registered_count,
-                                     capacity_max=capacity_max,
-                                     error='Please provide a valid email address')
-            
-            if not is_valid_email(registration_data['email']):
-                registered_count = len(db.get_participants_by_tournament(tournament_id))
-                capacity_max = tournament.get('max_participants')
-                return render_template('public/tournament_register.html', 
-                                     tournament=tournament, 
-                                     registered_count=registered_count,
-                                     capacity_max=capacity_max,
-                                     error='Please provide a valid email address format')
-            
-            # Validate name length
-            if len(registration_data['name']) < 2:
-                registered_count = len(db.get_participants_by_tournament(tournament_id))
-                capacity_max = tournament.get('max_participants')
-                return render_template('public/tournament_register.html', 
-                                     tournament=tournament, 
-                                     registered_count=registered_count,
-                                     capacity_max=capacity_max,
-                                     error='Name must be at least 2 characters long')
-            
+            # Validation rules, checked in order; the first failing one is reported
+            rules = (
+                (not registration_data['name'], 'Please provide your full name'),
+                (not registration_data['email'], 'Please provide a valid email address'),
+                (not is_valid_email(registration_data['email']), 'Please provide a valid email address format'),
+                (len(registration_data['name']) < 2, 'Name must be at least 2 characters long'),
+            )
         else:  # team tournament
             registration_data = {
                 'team_name': sanitize_input(request.form.get('team_name', ''), 50),
@@ -421,65 +357,27 @@ def tournament_register(tournament_id):
                 'phone': sanitize_input(request.form.get('phone', ''), 20)
             }
             
-            # Validate required fields
-            if not registration_data['team_name']:
-                registered_count = len(db.get_teams_by_tournament(tournament_id))
-                capacity_max = tournament.get('max_teams')
-                return render_template('public/tournament_register.html', 
-                                     tournament=tournament, 
-                                     registered_count=registered_count,
-                                     capacity_max=capacity_max,
-                                     error='Please provide a team name')
-            
-            if not registration_data['captain_name']:
-                registered_count = len(db.get_teams_by_tournament(tournament_id))
-                capacity_max = tournament.get('max_teams')
-                return render_template('public/tournament_register.html', 
-                                     tournament=tournament, 
-                                     registered_count=registered_count,
-                                     capacity_max=capacity_max,
-                                     error='Please provide the captain\'s name')
-            
-            if not registration_data['email']:
-                registered_count = len(db.get_teams_by_tournament(tournament_id))
-                capacity_max = tournament.get('max_teams')
-                return render_template('public/tournament_register.html', 
-                                     tournament=tournament, 
-                                     registered_count=registered_count,
-                                     capacity_max=capacity_max,
-                                     error='Please provide a valid email address')
-            
-            if not is_valid_email(registration_data['email']):
-                registered_count = len(db.get_teams_by_tournament(tournament_id))
-                capacity_max = tournament.get('max_teams')
-                return render_template('public/tournament_register.html', 
-                                     tournament=tournament, 
-                                     registered_count=registered_count,
-                                     capacity_max=capacity_max,
-                                     error='Please provide a valid email address format')
-            
-            # Validate lengths
-            if len(registration_data['team_name']) < 2:
-                registered_count = len(db.get_teams_by_tournament(tournament_id))
-                capacity_max = tournament.get('max_teams')
-                return render_template('public/tournament_register.html', 
-                                     tournament=tournament, 
-                                     registered_count=registered_count,
-                                     capacity_max=capacity_max,
-                                     error='Team name must be at least 2 characters long')
-            
-            if len(registration_data['captain_name']) < 2:
-                registered_count = len(db.get_teams_by_tournament(tournament_id))
-                capacity_max = tournament.get('max_teams')
-                return render_template('public/tournament_register.html', 
-                                     tournament=tournament, 
-                                     registered_count=registered_count,
-                                     capacity_max=capacity_max,
-                                     error='Captain name must be at least 2 characters long')
-            
-            # Auto-generate short name if not provided
-            if not registration_data['short_name']:
-                registration_data['short_name'] = registration_data['team_name'][:4].upper()
+            rules = (
+                (not registration_data['team_name'], 'Please provide a team name'),
+                (not registration_data['captain_name'], 'Please provide the captain\'s name'),
+                (not registration_data['email'], 'Please provide a valid email address'),
+                (not is_valid_email(registration_data['email']), 'Please provide a valid email address format'),
+                (len(registration_data['team_name']) < 2, 'Team name must be at least 2 characters long'),
+                (len(registration_data['captain_name']) < 2, 'Captain name must be at least 2 characters long'),
+            )
+        
+        error = next((message for failed, message in rules if failed), None)
+        if error:
+            registered_count, capacity_max = _registration_counts(tournament)
+            return render_template('public/tournament_register.html', 
+                                 tournament=tournament, 
+                                 registered_count=registered_count,
+                                 capacity_max=capacity_max,
+                                 error=error)
+        
+        # Auto-generate short name if not provided
+        if tournament['type'] != 'solo' and not registration_data['short_name']:
+            registration_data['short_name'] = registration_data['team_name'][:4].upper()
         
         # Register for tournament
         result = db.register_for_tournament(tournament_id, registration_data)
@@ -488,10 +386,10 @@ def tournament_register(tournament_id):
             # Compute latest counts for success page
             try:
                 if tournament.get('type') == 'solo':
-                    registered_count = len(db.get_participants_by_tournament(tournament_id))
+                    registered_count = db.count_participants(tournament_id)
                     capacity_max = tournament.get('max_participants')
                 else:
-                    registered_count = len(db.get_teams_by_tournament(tournament_id))
+                    registered_count = db.count_teams(tournament_id)
                     capacity_max = tournament.get('max_teams')
             except Exception:
                 registered_count = None
@@ -504,28 +402,18 @@ def tournament_register(tournament_id):
                                  success_message=result.get('message', 'Registration successful!'))
         else:
             # On failure, recompute counts
-            if tournament.get('type') == 'solo':
-                registered_count = len(db.get_participants_by_tournament(tournament_id))
-                capacity_max = tournament.get('max_participants')
-            else:
-                registered_count = len(db.get_teams_by_tournament(tournament_id))
-                capacity_max = tournament.get('max_teams')
+            registered_count, capacity_max = _registration_counts(tournament)
             return render_template('public/tournament_register.html', 
                                  tournament=tournament, 
                                  registered_count=registered_count,
                                  capacity_max=capacity_max,
                                  error=result.get('error', 'Registration failed'))
             
-    except Exception as e:
-        print(f"Error in tournament registration: {e}")
+    except Exception:
+        log.exception("Error in tournament registration")
         # On exception, recompute counts to re-render page properly
         try:
-            if tournament.get('type') == 'solo':
-                registered_count = len(db.get_participants_by_tournament(tournament_id))
-                capacity_max = tournament.get('max_participants')
-            else:
-                registered_count = len(db.get_teams_by_tournament(tournament_id))
-                capacity_max = tournament.get('max_teams')
+            registered_count, capacity_max = _registration_counts(tournament)
         except Exception:
             registered_count = 0
             capacity_max = None
@@ -556,66 +444,14 @@ def contact():
 def player_rankings():
     """Player rankings page showing top performing players"""
     try:
-        # Get all completed tournaments
-        all_tournaments = db.get_public_tournaments() or []
-        completed_tournaments = [t for t in all_tournaments if t.get('status') == 'completed']
-        
-        player_stats = {}
-        
-        # Aggregate player statistics across all tournaments
-        for tournament in completed_tournaments:
-            try:
-                if tournament.get('type') == 'solo':
-                    # Get standings for solo tournaments
-                    standings = db.get_tournament_standings(tournament['id']) or []
-                    for standing in standings:
-                        participant = standing.get('participant', {})
-                        player_name = participant.get('name', 'Unknown')
-                        
-                        if player_name not in player_stats:
-                            player_stats[player_name] = {
-                                'name': player_name,
-                                'tournaments_played': 0,
-                                'tournaments_won': 0,
-                                'total_points': 0,
-                                'total_wins': 0,
-                                'total_draws': 0,
-                                'total_losses': 0,
-                                'total_goals_for': 0,
-                                'total_goals_against': 0,
-                                'best_finish': float('inf')
-                            }
-                        
-                        stats = player_stats[player_name]
-                        stats['tournaments_played'] += 1
-                        stats['total_points'] += standing.get('points', 0)
-                        stats['total_wins'] += standing.get('wins', 0)
-                        stats['total_draws'] += standing.get('draws', 0)
-                        stats['total_losses'] += standing.get('losses', 0)
-                        stats['total_goals_for'] += standing.get('goals_for', 0)
-                        stats['total_goals_against'] += standing.get('goals_against', 0)
-                        
-                        # Track best finish (position in tournament)
-                        position = standing.get('position', len(standings) + 1)
-                        if position < stats['best_finish']:
-                            stats['best_finish'] = position
-                        
-                        # Count tournament wins (1st place)
-                        if position == 1:
-                            stats['tournaments_won'] += 1
-                            
-            except Exception as e:
-                print(f"Error processing tournament {tournament.get('id')} for player rankings: {e}")
-                continue
+        # Totals per player across completed solo tournaments, summed in the database
+        players_list = db.get_player_rankings() or []
         
-        # Convert to list and calculate additional metrics
-        players_list = []
-        for player_name, stats in player_stats.items():
-            if stats['tournaments_played'] > 0:
-                stats['avg_points_per_tournament'] = stats['total_points'] / stats['tournaments_played']
-                stats['win_rate'] = (stats['total_wins'] / max(stats['total_wins'] + stats['total_draws'] + stats['total_losses'], 1)) * 100
-                stats['goal_difference'] = stats['total_goals_for'] - stats['total_goals_against']
-                players_list.append(stats)
+        # Calculate additional metrics
+        for stats in players_list:
+            stats['avg_points_per_tournament'] = stats['total_points'] / stats['tournaments_played']
+            stats['win_rate'] = (stats['total_wins'] / max(stats['total_wins'] + stats['total_draws'] + stats['total_losses'], 1)) * 100
+            stats['goal_difference'] = stats['total_goals_for'] - stats['total_goals_against']
         
         # Sort by different criteria
         top_by_tournaments_won = sorted(players_list, key=lambda x: (x['tournaments_won'], x['total_points']), reverse=True)[:10]
@@ -630,8 +466,8 @@ def player_rankings():
                              top_by_goals=top_by_goals,
                              total_players=len(players_list))
         
-    except Exception as e:
-        print(f"Error fetching player rankings: {e}")
+    except Exception:
+        log.exception("Error fetching player rankings")
         return render_template('public/player_rankings.html',
                              top_by_tournaments_won=[],
                              top_by_points=[],
@@ -691,8 +527,8 @@ def team_rankings():
                     if position == 1:
                         stats['tournaments_won'] += 1
                         
-            except Exception as e:
-                print(f"Error processing tournament {tournament.get('id')} for team rankings: {e}")
+            except Exception:
+                log.exception("Error processing tournament %s for team rankings", tournament.get('id'))
                 continue
         
         # Convert to list and calculate additional metrics
@@ -717,8 +553,8 @@ def team_rankings():
                              top_by_goals=top_by_goals,
                              total_teams=len(teams_list))
         
-    except Exception as e:
-        print(f"Error fetching team rankings: {e}")
+    except Exception:
+        log.exception("Error fetching team rankings")
         return render_template('public/team_rankings.html',
                              top_by_tournaments_won=[],
                              top_by_points=[],
@@ -733,12 +569,7 @@ def api_stats():
     user_id = session['user_id']
     tournaments = db.get_tournaments_by_user(user_id)
     
-    stats = {
-        'total_tournaments': len(tournaments),
-        'active_tournaments': len([t for t in tournaments if t.get('status') == 'in_progress']),
-        'completed_tournaments': len([t for t in tournaments if t.get('status') == 'completed']),
-        'upcoming_tournaments': len([t for t in tournaments if t.get('status') in ['draft', 'registration_open']])
-    }
+    stats = _tournament_status_stats(tournaments)
     
     return jsonify(stats)
 
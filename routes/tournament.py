@@ -1,10 +1,11 @@
 from flask import Blueprint, render_template, request, redirect, url_for, flash, session, jsonify
-from routes.auth import login_required, get_current_user
+from routes.auth import login_required, get_current_user, get_current_tournament
 from database import db
 from datetime import datetime, timedelta
 import uuid
 import random
 from tournament_generator import TournamentGenerator
+from context_processors import invalidate_tournament_name
 
 tournament_bp = Blueprint('tournament', __name__)
 
@@ -172,7 +173,7 @@ def create():
 @tournament_bp.route('/<tournament_id>')
 def view(tournament_id):
     """View tournament details"""
-    tournament = db.get_tournament_by_id(tournament_id)
+    tournament = get_current_tournament(tournament_id)
     if not tournament:
         flash('Tournament not found', 'error')
         return redirect(url_for('main.dashboard'))
@@ -182,11 +183,9 @@ def view(tournament_id):
     participants = []
     
     if tournament.get('type') == 'solo':
-        participants = db.get_participants_by_tournament(tournament_id)
-        matches = db.get_solo_matches_by_tournament(tournament_id)
+        participants, matches = db.get_tournament_page(tournament_id, 'solo')
     else:
-        teams = db.get_teams_by_tournament(tournament_id)
-        matches = db.get_matches_by_tournament(tournament_id)
+        teams, matches = db.get_tournament_page(tournament_id, 'team')
     
     # Check if user is organizer
     is_organizer = session.get('user_id') == tournament.get('organizer_id')
@@ -328,6 +327,7 @@ def edit(tournament_id):
         
         result = db.update_tournament(tournament_id, update_data)
         if result['success']:
+            invalidate_tournament_name(tournament_id)
             flash('Tournament updated successfully!', 'success')
             return redirect(url_for('tournament.view', tournament_id=tournament_id))
         else:
@@ -625,19 +625,18 @@ def generate_fixtures(tournament_id):
             'tournament_format': tournament.get('format')
         }
         
-        # Save solo matches to database
+        # Save solo matches to database in one insert
         created_matches = []
         failed_matches = []
         
-        for match_data in matches:
-            result = db.create_solo_match(match_data)
-            if result['success']:
-                created_matches.append(result['match'])
-            else:
-                failed_matches.append({
-                    'match_data': match_data,
-                    'error': result.get('error', 'Unknown error')
-                })
+        result = db.create_solo_matches_batch(matches) if matches else {'success': True, 'matches': []}
+        if result['success']:
+            created_matches = result['matches']
+        else:
+            failed_matches = [{
+                'match_data': match_data,
+                'error': result.get('error', 'Unknown error')
+            } for match_data in matches]
         
         return jsonify({
             'success': True, 
@@ -657,12 +656,12 @@ def generate_fixtures(tournament_id):
         generator = TournamentGenerator(tournament, teams)
         matches = generator.generate_matches()
         
-        # Save matches to database
+        # Save matches to database in one insert
         created_matches = []
-        for match_data in matches:
-            result = db.create_match(match_data)
+        if matches:
+            result = db.create_matches_batch(matches)
             if result['success']:
-                created_matches.append(result['match'])
+                created_matches = result['matches']
         
         return jsonify({
             'success': True, 
@@ -680,8 +679,7 @@ def standings(tournament_id):
     
     # Handle solo vs team tournaments differently
     if tournament.get('type') == 'solo':
-        participants = db.get_participants_by_tournament(tournament_id)
-        matches = db.get_solo_matches_by_tournament(tournament_id)
+        participants, matches = db.get_tournament_page(tournament_id, 'solo')
         print(f"Solo Tournament Debug: {len(participants)} participants, {len(matches)} matches")
         
         # Debug completed matches
@@ -693,8 +691,7 @@ def standings(tournament_id):
         # Calculate participant standings
         standings_data = calculate_participant_standings(participants, matches)
     else:
-        teams = db.get_teams_by_tournament(tournament_id)
-        matches = db.get_matches_by_tournament(tournament_id)
+        teams, matches = db.get_tournament_page(tournament_id, 'team')
         print(f"Team Tournament Debug: {len(teams)} teams, {len(matches)} matches")
         
         # Debug completed matches
@@ -746,12 +743,10 @@ def statistics(tournament_id):
     
     # Get data based on tournament type
     if tournament.get('type') == 'solo':
-        participants = db.get_participants_by_tournament(tournament_id)
-        matches = db.get_solo_matches_by_tournament(tournament_id)
+        participants, matches = db.get_tournament_page(tournament_id, 'solo')
         standings_data = calculate_participant_standings(participants, matches)
     else:
-        teams = db.get_teams_by_tournament(tournament_id)
-        matches = db.get_matches_by_tournament(tournament_id)
+        teams, matches = db.get_tournament_page(tournament_id, 'team')
         standings_data = calculate_standings(teams, matches, tournament)
     
     # Calculate comprehensive statistics
@@ -887,10 +882,10 @@ def generate_solo_fixtures(tournament_id):
     matches = generate_solo_matches(tournament, participants)
 
     created_matches = []
-    for match_data in matches:
-        result = db.create_solo_match(match_data)
+    if matches:
+        result = db.create_solo_matches_batch(matches)
         if result['success']:
-            created_matches.append(result['match'])
+            created_matches = result['matches']
 
     return jsonify({
         'success': True,
@@ -1597,28 +1592,9 @@ def save_match_result(tournament_id, match_id):
                     team1_score = (team1_wins * 3) + draws
                     team2_score = (team2_wins * 3) + draws
                 
-                # Check if this match already has sub-matches (editing mode)
-                print("Checking for existing sub-matches...")
-                existing_sub_matches = db.get_sub_matches_by_parent_match(match_id)
-                if existing_sub_matches:
-                    print(f"Found {len(existing_sub_matches)} existing sub-matches. Clearing them first.")
-                    # Delete existing sub-matches and their participants
-                    print("Deleting existing sub-matches...")
-                    delete_result = db.delete_sub_matches_by_parent_match(match_id)
-                    if not delete_result.get('success'):
-                        return jsonify({'success': False, 'error': f'Failed to clear existing sub-matches: {delete_result.get("error", "Unknown error")}'})
-                    
-                    # Delete existing match participants
-                    print("Deleting existing match participants...")
-                    participants_result = db.delete_match_participants_by_match(match_id)
-                    if not participants_result.get('success'):
-                        print(f"Warning: Failed to clear existing participants: {participants_result.get('error', 'Unknown error')}")
-                else:
-                    print("No existing sub-matches found.")
-                
-                # Save sub-matches to database using batch operation
-                print(f"Saving {len(sub_matches_data)} sub-matches in batch...")
-                batch_result = db.create_sub_matches_batch(sub_matches_data)
+                # Replace any existing sub-matches (editing mode) and save the new ones in one transaction
+                print(f"Saving {len(sub_matches_data)} sub-matches...")
+                batch_result = db.replace_sub_matches(match_id, sub_matches_data)
                 if not batch_result.get('success'):
                     return jsonify({'success': False, 'error': f'Failed to save sub-matches: {batch_result.get("error", "Unknown error")}'})
                 